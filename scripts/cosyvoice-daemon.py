@@ -5,23 +5,27 @@ CosyVoice TTS Daemon - keeps model loaded for fast synthesis.
 Automatically shuts down after IDLE_TIMEOUT_MINUTES of inactivity.
 """
 import asyncio
-import io
+import glob
 import os
 import signal
+import struct
 import sys
 import threading
 import time
 from contextlib import asynccontextmanager
+from typing import Literal
 
 # Add CosyVoice paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 COSYVOICE_DIR = os.path.join(SCRIPT_DIR, "..", "speech", "cosyvoice")
 sys.path.insert(0, COSYVOICE_DIR)  # Add CosyVoice root for cosyvoice module
 sys.path.insert(0, os.path.join(COSYVOICE_DIR, "third_party", "Matcha-TTS"))
+SAMPLES_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "speech", "samples"))
 os.chdir(COSYVOICE_DIR)
 
-from fastapi import FastAPI, Response
-from fastapi.responses import JSONResponse
+import numpy as np
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -29,122 +33,346 @@ import uvicorn
 IDLE_TIMEOUT_MINUTES = int(os.environ.get("COSYVOICE_IDLE_TIMEOUT", "30"))
 PORT = int(os.environ.get("COSYVOICE_PORT", "8765"))
 HOST = os.environ.get("COSYVOICE_HOST", "127.0.0.1")
+# Uvicorn worker processes for CPU-only hosts, each with its own model copy
+# (ignored on CUDA, where the model lives in device memory)
+WORKERS = int(os.environ.get("COSYVOICE_WORKERS", "1"))
+# Touched on every request when there are several workers, so the idle check
+# sees activity from all of them, not just its own process
+ACTIVITY_FILE = os.path.join(COSYVOICE_DIR, f".daemon-{PORT}.activity")
+# torch.compile the flow decoder on Ampere+ GPUs (set to 0 to disable)
+COMPILE = os.environ.get("COSYVOICE_COMPILE", "1") == "1"
+DEFAULT_PROMPT = "./asset/zero_shot_prompt.wav"
+IDLE_CHECK_SECONDS = 30
+# Longest a request waits for its first chunk; below tts.py's 60 s client
+# timeout, so callers get an error response instead of a dropped connection
+FIRST_CHUNK_TIMEOUT_SECONDS = 50
+# Clients should reuse one connection (requests.Session / httpx.Client)
+KEEP_ALIVE_SECONDS = 120
+KEEP_ALIVE_HEADERS = {"Connection": "keep-alive", "Keep-Alive": f"timeout={KEEP_ALIVE_SECONDS}"}
+LANG_TAGS = {
+    "zh": sys.intern("<|zh|>"),
+    "en": sys.intern("<|en|>"),
+    "ja": sys.intern("<|ja|>"),
+    "ko": sys.intern("<|ko|>"),
+}
+STREAM_DATA_SIZE = 0xFFFFFFFF  # WAV length placeholder for streamed responses
+# Warm-up sentences per language, short to long, so the CUDA graphs for the
+# default prompt are recorded before the first queued request runs
+WARMUP_TEXTS = {
+    "zh": ["你好。", "你好，很高兴认识你。今天天气怎么样？"],
+    "en": ["Hello.", "Hello there, nice to meet you. How is the weather today?"],
+    "ja": ["こんにちは。", "こんにちは、はじめまして。今日の天気はどうですか？"],
+    "ko": ["안녕하세요.", "안녕하세요, 만나서 반갑습니다. 오늘 날씨는 어때요?"],
+}
 
 # Global state
 model = None
-last_request_time = time.time()
-shutdown_event = threading.Event()
+last_request_time = time.monotonic()
+idle_timer: asyncio.TimerHandle | None = None
+request_queue: asyncio.Queue | None = None
+worker_task: asyncio.Task | None = None
+warm_up_state = "none"  # "running", "done" or "failed" when the model is compiled
+eager_forward = None  # The flow estimator's forward before torch.compile
+prompt_speakers: dict[str, str] = {}  # abs ref audio path -> zero_shot_spk_id
 
 
 class SynthesizeRequest(BaseModel):
     text: str
-    lang: str = "zh"  # zh, en, ja, ko
+    lang: Literal["zh", "en", "ja", "ko"] = "zh"
     ref_audio: str = ""  # Path to reference audio for voice cloning
     instruct: str = ""  # Instruction for accent/dialect/emotion (e.g., "Speak with Indian accent")
 
 
-def load_model():
-    """Load CosyVoice model."""
+def wav_header_pcm16(sr: int, data_size: int = STREAM_DATA_SIZE) -> bytes:
+    """Build a 44-byte mono 16-bit PCM WAV header (unknown length by default)."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", min(36 + data_size, STREAM_DATA_SIZE), b"WAVE",
+        b"fmt ", 16, 1, 1, sr, sr * 2, 2, 16,  # PCM, mono, 16-bit
+        b"data", data_size,
+    )
+
+
+def encode_pcm16(samples) -> memoryview:
+    """Convert a mono float waveform tensor to little-endian int16 PCM bytes."""
+    x = samples.detach().cpu().numpy().reshape(-1)
+    scaled = np.multiply(x, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    # Cast straight into the output buffer rather than via astype + tobytes
+    buf = bytearray(scaled.size * 2)
+    np.frombuffer(buf, dtype="<i2")[:] = scaled
+    return memoryview(buf)
+
+
+def load_model() -> bool:
+    """Load CosyVoice model. Returns True if it was compiled and needs a warm_up()."""
     global model
     print("Loading CosyVoice model...", flush=True)
+    import torch
     from cosyvoice.cli.cosyvoice import AutoModel
-    model = AutoModel(model_dir="pretrained_models/CosyVoice2-0.5B")
+    use_cuda = torch.cuda.is_available()
+    if not use_cuda and WORKERS > 1:
+        # Split the cores between workers so their threadpools don't oversubscribe
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // WORKERS))
+    # fp16 halves weight bandwidth; CosyVoice only honours it on CUDA
+    model = AutoModel(model_dir="pretrained_models/CosyVoice2-0.5B", fp16=use_cuda)
     print("Model loaded!", flush=True)
 
-
-def idle_watchdog():
-    """Shutdown server after idle timeout."""
+    compile_model = (
+        COMPILE and use_cuda and torch.cuda.get_device_capability()[0] >= 8
+    )
+    if compile_model:
+        # The flow decoder estimator runs once per ODE step and dominates
+        # per-chunk latency (it's also what CosyVoice swaps out for TensorRT)
+        global eager_forward
+        estimator = model.model.flow.decoder.estimator
+        eager_forward = estimator.forward
+        estimator.forward = torch.compile(
+            estimator.forward, mode="reduce-overhead", dynamic=True, fullgraph=False
+        )
+
+    # Pre-extract prompt features for the default prompt and bundled samples
+    for ref_path in [DEFAULT_PROMPT] + sorted(glob.glob(os.path.join(SAMPLES_DIR, "*", "*.wav"))):
+        try:
+            get_prompt_speaker(ref_path)
+        except Exception as e:
+            print(f"Skipping prompt {ref_path}: {e}", flush=True)
+    print(f"Cached {len(prompt_speakers)} prompt(s)", flush=True)
+
+    return compile_model
+
+
+def warm_up():
+    """
+    Compile the model for the common input shapes, once each.
+
+    reduce-overhead records a CUDA graph per input shape; with the prompt
+    fixed, the shapes vary only with language and text length. If compiling
+    fails, the model goes back to eager mode and keeps serving.
+    """
+    global warm_up_state
+    print("Warming up compiled model...", flush=True)
+    try:
+        for lang, texts in WARMUP_TEXTS.items():
+            for text in texts:
+                for _ in iter_inference(LANG_TAGS[lang] + text, DEFAULT_PROMPT, ""):
+                    pass
+    except Exception as e:
+        print(f"Warm-up failed, serving uncompiled: {e!r}", flush=True)
+        model.model.flow.decoder.estimator.forward = eager_forward
+        warm_up_state = "failed"
+    else:
+        print("Warm-up done", flush=True)
+        warm_up_state = "done"
+
+
+def get_prompt_speaker(ref_audio_path: str) -> str:
+    """
+    Return the zero-shot speaker id for a reference WAV.
+
+    The first call extracts the prompt speech tokens, mel features and
+    speaker embedding via the model frontend; later calls reuse them.
+    """
+    key = os.path.abspath(ref_audio_path)
+    spk_id = prompt_speakers.get(key)
+    if spk_id is None:
+        spk_id = f"prompt_{len(prompt_speakers)}"
+        model.add_zero_shot_spk("", key, spk_id)
+        prompt_speakers[key] = spk_id
+    return spk_id
+
+
+def mark_activity():
+    """Record a request, for the idle timeout."""
     global last_request_time
-    while not shutdown_event.is_set():
-        idle_seconds = time.time() - last_request_time
-        idle_minutes = idle_seconds / 60
-        if idle_minutes >= IDLE_TIMEOUT_MINUTES:
-            print(f"Idle for {idle_minutes:.1f} minutes, shutting down...", flush=True)
-            os.kill(os.getpid(), signal.SIGTERM)
-            break
-        # Check every 30 seconds
-        shutdown_event.wait(30)
+    last_request_time = time.monotonic()
+    if WORKERS > 1:
+        try:
+            os.utime(ACTIVITY_FILE)
+        except FileNotFoundError:
+            open(ACTIVITY_FILE, "a").close()
+
+
+def idle_seconds() -> float:
+    """Seconds since the last request to any worker."""
+    if WORKERS > 1:
+        try:
+            return time.time() - os.path.getmtime(ACTIVITY_FILE)
+        except FileNotFoundError:
+            pass
+    return time.monotonic() - last_request_time
+
+
+def check_idle(loop: asyncio.AbstractEventLoop):
+    """Shutdown server after idle timeout; otherwise re-arm the idle timer."""
+    global idle_timer
+    idle_minutes = idle_seconds() / 60
+    if idle_minutes >= IDLE_TIMEOUT_MINUTES:
+        print(f"Idle for {idle_minutes:.1f} minutes, shutting down...", flush=True)
+        # With multiple workers, all of them are idle by now, so stop the
+        # supervisor rather than one worker (which it would just respawn)
+        os.kill(os.getppid() if WORKERS > 1 else os.getpid(), signal.SIGTERM)
+        return
+    idle_timer = loop.call_later(IDLE_CHECK_SECONDS, check_idle, loop)
+
+
+def iter_inference(tagged_text: str, ref_audio_path: str, instruct_text: str):
+    """Run one synthesis on the loaded model, yielding audio chunks as they are produced."""
+    if instruct_text:
+        # Cached speakers carry their own prompt text, which would replace the
+        # instruction, so instruct mode always extracts from the WAV
+        results = model.inference_instruct2(tagged_text, instruct_text, ref_audio_path, stream=True)
+    else:
+        spk_id = get_prompt_speaker(ref_audio_path)
+        results = model.inference_cross_lingual(
+            tagged_text, ref_audio_path, zero_shot_spk_id=spk_id, stream=True
+        )
+    for result in results:
+        yield result["tts_speech"]
+
+
+def run_request(item: tuple, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Run one queued request on the model thread.
+
+    Its queue receives PCM chunks as they are produced, then None when done
+    (preceded by the exception if synthesis failed).
+    """
+    tagged_text, ref_audio_path, instruct_text, chunks, abandoned = item
+    if abandoned.is_set():
+        return  # The client already gave up waiting
+    try:
+        for speech in iter_inference(tagged_text, ref_audio_path, instruct_text):
+            loop.call_soon_threadsafe(chunks.put_nowait, encode_pcm16(speech))
+    except Exception as e:
+        loop.call_soon_threadsafe(chunks.put_nowait, e)
+    loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+
+async def request_worker(compiled: bool):
+    """
+    Serve queued requests one at a time on the model thread.
+
+    CosyVoice has no batched inference entry point, so requests are not
+    held back to form batches; each starts as soon as the model is free.
+    A compiled model is warmed up first, after the server is already
+    listening; /health reports not ready until that's done, so clients
+    wait for it rather than queueing behind it.
+    """
+    loop = asyncio.get_running_loop()
+    if compiled:
+        await asyncio.to_thread(warm_up)
+    while True:
+        item = await request_queue.get()
+        try:
+            await asyncio.to_thread(run_request, item, loop)
+        except Exception as e:
+            # run_request reports synthesis errors itself; don't let anything
+            # else kill the only consumer of the queue
+            print(f"Request failed: {e!r}", flush=True)
+            item[3].put_nowait(e)
+            item[3].put_nowait(None)
+        # Long requests count as activity so the watchdog doesn't fire mid-queue
+        mark_activity()
+
+
+async def stream_wav(first: memoryview, chunks: asyncio.Queue, sr: int):
+    """Yield a streamed WAV: the header, then PCM chunks as the model produces them."""
+    yield wav_header_pcm16(sr)
+    chunk = first
+    while isinstance(chunk, memoryview):
+        yield chunk
+        chunk = await chunks.get()
+    if isinstance(chunk, Exception):
+        # Headers are already sent, so all we can do is end the stream early
+        print(f"Synthesis failed mid-stream: {chunk}", flush=True)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
-    # Startup: load model and start watchdog
-    load_model()
-    watchdog_thread = threading.Thread(target=idle_watchdog, daemon=True)
-    watchdog_thread.start()
+    global request_queue, worker_task, warm_up_state
+    # Startup: load model, start request queue and idle timer
+    compiled = load_model()
+    mark_activity()
+    if compiled:
+        warm_up_state = "running"
+    request_queue = asyncio.Queue()
+    worker_task = asyncio.create_task(request_worker(compiled))
+    check_idle(asyncio.get_running_loop())
     yield
     # Shutdown
-    shutdown_event.set()
+    worker_task.cancel()
+    if idle_timer:
+        idle_timer.cancel()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.get("/health")
 async def health():
-    """Health check endpoint."""
-    global last_request_time
-    idle_seconds = time.time() - last_request_time
-    return {
-        "status": "ok",
+    """Health check endpoint (503 if requests can no longer be served)."""
+    serving = worker_task is not None and not worker_task.done()
+    body = {
+        "status": "ok" if serving else "error",
         "model_loaded": model is not None,
-        "idle_seconds": int(idle_seconds),
+        # Clients should wait for ready before sending requests
+        "ready": serving and model is not None and warm_up_state != "running",
+        "warm_up": warm_up_state,
+        "idle_seconds": int(idle_seconds()),
         "idle_timeout_minutes": IDLE_TIMEOUT_MINUTES,
     }
+    return ORJSONResponse(body, status_code=200 if serving else 503)
 
 
 @app.post("/synthesize")
 async def synthesize(request: SynthesizeRequest):
     """Synthesize speech from text."""
-    global last_request_time
-    last_request_time = time.time()
+    mark_activity()
 
     if model is None:
-        return JSONResponse({"error": "Model not loaded"}, status_code=503)
+        return ORJSONResponse({"error": "Model not loaded"}, status_code=503)
+    if worker_task is None or worker_task.done():
+        return ORJSONResponse({"error": "Request worker stopped"}, status_code=503)
 
     try:
-        import torchaudio
-
         # Add language tag
-        lang_tags = {"zh": "<|zh|>", "en": "<|en|>", "ja": "<|ja|>", "ko": "<|ko|>"}
-        tagged_text = lang_tags.get(request.lang, "<|zh|>") + request.text
+        tagged_text = LANG_TAGS[request.lang] + request.text
 
         # Use provided ref_audio or default
-        ref_audio_path = request.ref_audio if request.ref_audio else "./asset/zero_shot_prompt.wav"
+        ref_audio_path = request.ref_audio if request.ref_audio else DEFAULT_PROMPT
 
-        # Generate audio - use instruct mode if instruction provided
-        audio_data = None
-        if request.instruct:
+        # Use instruct mode if instruction provided
+        instruct_text = request.instruct
+        if instruct_text and not instruct_text.endswith("<|endofprompt|>"):
             # Ensure instruction ends with prompt marker
-            instruct_text = request.instruct
-            if not instruct_text.endswith("<|endofprompt|>"):
-                instruct_text = instruct_text + "<|endofprompt|>"
-
-            for _, result in enumerate(
-                model.inference_instruct2(tagged_text, instruct_text, ref_audio_path)
-            ):
-                audio_data = result["tts_speech"]
-                break
-        else:
-            for _, result in enumerate(
-                model.inference_cross_lingual(tagged_text, ref_audio_path)
-            ):
-                audio_data = result["tts_speech"]
-                break
-
-        if audio_data is None:
-            return JSONResponse({"error": "No audio generated"}, status_code=500)
-
-        # Convert to WAV bytes
-        buffer = io.BytesIO()
-        torchaudio.save(buffer, audio_data, model.sample_rate, format="wav")
-        buffer.seek(0)
-
-        return Response(content=buffer.read(), media_type="audio/wav")
+            instruct_text = instruct_text + "<|endofprompt|>"
+
+        # Queue for the request worker and wait for the first chunk, so errors
+        # before any audio is produced can still be reported as JSON
+        chunks = asyncio.Queue()
+        abandoned = threading.Event()
+        await request_queue.put((tagged_text, ref_audio_path, instruct_text, chunks, abandoned))
+        try:
+            first = await asyncio.wait_for(chunks.get(), FIRST_CHUNK_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            abandoned.set()  # Skip it if it hasn't started yet
+            return ORJSONResponse({"error": "Timed out waiting for audio"}, status_code=504)
+
+        if isinstance(first, Exception):
+            raise first
+        if first is None:
+            return ORJSONResponse({"error": "No audio generated"}, status_code=500)
+
+        return StreamingResponse(
+            stream_wav(first, chunks, model.sample_rate),
+            media_type="audio/wav",
+            headers=KEEP_ALIVE_HEADERS,
+        )
 
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
 @app.post("/shutdown")
@@ -157,4 +385,36 @@ async def shutdown():
 if __name__ == "__main__":
     print(f"Starting CosyVoice daemon on {HOST}:{PORT}", flush=True)
     print(f"Idle timeout: {IDLE_TIMEOUT_MINUTES} minutes", flush=True)
-    uvicorn.run(app, host=HOST, port=PORT, log_level="warning")
+    # On GPU the model is an in-process singleton and the request queue
+    # serializes access to it; on CPU extra workers share the listening socket
+    # and the kernel spreads connections across them
+    if WORKERS > 1:
+        import torch
+        if torch.cuda.is_available():
+            print("CUDA available, ignoring COSYVOICE_WORKERS", flush=True)
+            WORKERS = 1  # The in-process app reads this, e.g. in check_idle()
+        else:
+            print(f"Workers: {WORKERS}", flush=True)
+            mark_activity()  # Create the shared activity file before workers start
+    if WORKERS > 1:
+        # Multiple workers need an import string; we've chdir'd away from here
+        sys.path.insert(0, SCRIPT_DIR)
+        target = os.path.splitext(os.path.basename(__file__))[0] + ":app"
+    else:
+        target = app
+    uvicorn.run(
+        target,
+        host=HOST,
+        port=PORT,
+        log_level="warning",
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        timeout_keep_alive=KEEP_ALIVE_SECONDS,
+        workers=WORKERS,
+    )
+    if WORKERS > 1:
+        try:
+            os.unlink(ACTIVITY_FILE)
+        except FileNotFoundError:
+            pass
@@ -75,10 +75,10 @@ cmd_start() {
     echo "  Port: $PORT"
     echo "  Idle timeout: $IDLE_TIMEOUT minutes"
 
-    # Install FastAPI/uvicorn if needed
-    if ! "$VENV_DIR/bin/python" -c "import fastapi, uvicorn" 2>/dev/null; then
+    # Install FastAPI/uvicorn (with uvloop + httptools) and orjson if needed
+    if ! "$VENV_DIR/bin/python" -c "import fastapi, uvicorn, uvloop, httptools, orjson" 2>/dev/null; then
         echo "Installing FastAPI and uvicorn..."
-        "$VENV_DIR/bin/pip" install -q fastapi uvicorn
+        "$VENV_DIR/bin/pip" install -q fastapi "uvicorn[standard]" orjson
     fi
 
     # Start daemon in background
@@ -3,8 +3,13 @@
 Common utilities shared between TTS and STT demos.
 """
 import os
+import shutil
+import struct
 import subprocess
 import tempfile
+import time
+import weakref
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -25,29 +30,57 @@ CHANNELS = 1  # Mono
 # Time Formatting
 # =============================================================================
 
+_MINUTES = [f"{i:02d}" for i in range(100)]
+
+
+@lru_cache(maxsize=128)
+def _format_deciseconds(deciseconds: int) -> str:
+    """Format a whole number of tenths of a second as MM:SS.s"""
+    mins, rem = divmod(deciseconds, 600)
+    secs, tenths = divmod(rem, 10)
+    mm = _MINUTES[mins] if mins < 100 else str(mins)
+    return f"{mm}:{secs:02d}.{tenths}"
+
+
 def format_time(seconds: float) -> str:
     """Format seconds as MM:SS.s"""
-    mins = int(seconds // 60)
-    secs = seconds % 60
-    return f"{mins:02d}:{secs:04.1f}"
+    return _format_deciseconds(int(seconds * 10))
 
 
 # =============================================================================
 # Audio Playback (uses afplay to avoid sounddevice conflicts with Textual)
 # =============================================================================
 
+# Absolute path so Popen can take its posix_spawn fast path. Our own fds are
+# non-inheritable (PEP 446), so close_fds=False doesn't leak them.
+_AFPLAY = shutil.which("afplay") or "/usr/bin/afplay"
+
+# Players started by play_audio_file, so stop_audio can signal them directly
+_audio_procs: "weakref.WeakSet[subprocess.Popen]" = weakref.WeakSet()
+
+
 def stop_audio():
-    """Stop any currently playing audio."""
-    subprocess.run(['killall', 'afplay'], stderr=subprocess.DEVNULL)
+    """Stop any audio started by play_audio_file."""
+    for proc in list(_audio_procs):
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=0.05)
+            except subprocess.TimeoutExpired:
+                pass
+        _audio_procs.discard(proc)
 
 
 def play_audio_file(wav_path: str) -> subprocess.Popen:
     """Start playing audio file, return process handle."""
-    return subprocess.Popen(
-        ['afplay', wav_path],
+    proc = subprocess.Popen(
+        [_AFPLAY, wav_path],
         stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL
+        stderr=subprocess.DEVNULL,
+        close_fds=False,  # with an absolute path, lets Popen use posix_spawn
     )
+    _audio_procs.add(proc)
+    return proc
 
 
 def play_samples(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> tuple[subprocess.Popen, str]:
@@ -71,8 +104,33 @@ def save_audio(samples: np.ndarray, path: str, sample_rate: int = SAMPLE_RATE) -
     sf.write(path, samples, sample_rate)
 
 
+def _wav_data_offset(path: str) -> Optional[int]:
+    """Return the byte offset of a RIFF/WAVE file's data chunk, or None."""
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, size = struct.unpack('<4sI', chunk)
+            if chunk_id == b'data':
+                return f.tell()
+            f.seek(size + (size & 1), os.SEEK_CUR)  # chunks are word-aligned
+
+
 def load_audio(path: str) -> tuple[np.ndarray, int]:
     """Load audio from WAV file. Returns (samples, sample_rate)."""
+    info = sf.info(path)
+    if info.format == 'WAV' and info.subtype == 'PCM_16' and info.channels == 1:
+        # Mono 16-bit PCM: scale straight from a memory map of the data chunk
+        offset = _wav_data_offset(path)
+        if offset is not None:
+            pcm = np.memmap(path, dtype='<i2', mode='r', offset=offset, shape=(info.frames,))
+            samples = np.empty(info.frames, dtype=np.float32)
+            np.multiply(pcm, np.float32(1 / 32768), out=samples)
+            return samples, info.samplerate
     samples, sr = sf.read(path, dtype=np.float32)
     return samples, sr
 
@@ -95,14 +153,27 @@ class ReadlineInput(Input):
 # Audio Device Utilities
 # =============================================================================
 
+# Input device list cached by get_input_devices for INPUT_DEVICES_TTL seconds
+INPUT_DEVICES_TTL = 5.0
+_input_devices_cache: Optional[list] = None
+_input_devices_cached_at = 0.0
+
+
 def get_input_devices() -> list:
     """
     Get list of available audio input devices.
     Returns list of (device_idx, name, is_default) tuples.
 
+    Results are cached for INPUT_DEVICES_TTL seconds.
+
     NOTE: This imports sounddevice and should be called BEFORE starting
     the Textual app to avoid event loop conflicts.
     """
+    global _input_devices_cache, _input_devices_cached_at
+    now = time.monotonic()
+    if _input_devices_cache is not None and now - _input_devices_cached_at < INPUT_DEVICES_TTL:
+        return _input_devices_cache
+
     import sounddevice as sd
     devices = []
     try:
@@ -114,4 +185,6 @@ def get_input_devices() -> list:
                 devices.append((i, d['name'], is_default))
     except Exception:
         pass
+    _input_devices_cache = devices
+    _input_devices_cached_at = now
     return devices
@@ -9,16 +9,28 @@ Controls:
   Space       = Pause/resume auto-advance
   q           = Quit
 """
+import itertools
 import os
+import re
+import shutil
+import struct
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Callable, Iterator
 
 # Add parent dir to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Textual waits ESCDELAY ms after ESC to tell a bare Escape (quit) from an
+# arrow-key sequence; its 100 ms default makes quitting feel laggy. Must be
+# set before textual is imported.
+os.environ.setdefault("ESCDELAY", "25")
+
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -32,10 +44,9 @@ from textual.widgets import (
     Select,
     Static,
 )
-from textual.worker import Worker, WorkerState
+from textual.worker import Worker, WorkerState, get_current_worker
 
 import numpy as np
-import soundfile as sf
 
 
 # =============================================================================
@@ -71,18 +82,27 @@ LANG_GREETINGS = {
 }
 DEFAULT_TEXT = LANG_GREETINGS["a"]
 
+# Text placeholders, each filled from the Voice attribute of the same name.
+# A regex rather than str.format_map, so stray braces in user text are kept.
+_PLACEHOLDER_PATTERN = re.compile(r"\{(name|nationality_article|nationality|gender|notes)\}")
+
+# Number of upcoming voices to synthesize in the background while one plays
+PREFETCH_COUNT = 3
+# Quiet period after the last keystroke before the text input is re-checked
+INPUT_DEBOUNCE_SECONDS = 0.2
+
 
 def get_greeting_for_lang(lang_prefix: str) -> str:
     """Get the greeting template for a language prefix."""
     return LANG_GREETINGS.get(lang_prefix, DEFAULT_TEXT)
 
 # Import language metadata from tts module (single source of truth)
-from tts import VOICE_LANG_META, get_article, is_cosyvoice_available
+from tts import VOICE_LANG_META, get_article
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Voice:
-    """Voice definition with properties derived from voice_id."""
+    """Voice definition with properties derived from voice_id at construction."""
     voice_id: str
     notes: str = ""
     # Override fields for non-standard voice IDs (like CosyVoice)
@@ -91,58 +111,38 @@ class Voice:
     _lang_code: str = ""
     _ref_audio: str = ""  # Reference audio path for CosyVoice cloning
 
-    @property
-    def name(self) -> str:
-        """Derive name from voice_id (e.g., 'af_heart' -> 'Heart')."""
-        if self._name:
-            return self._name
-        return self.voice_id.split("_", 1)[1].title()
-
-    @property
-    def gender(self) -> str:
-        """Derive gender from voice_id[1] ('f'=Female, 'm'=Male)."""
-        if self._gender:
-            return self._gender
-        return "Female" if self.voice_id[1] == "f" else "Male"
-
-    @property
-    def lang_code(self) -> str:
-        """Derive language code from voice_id[0]."""
-        if self._lang_code:
-            return self._lang_code
-        return VOICE_LANG_META.get(self.voice_id[0], ("en-us", ""))[0]
-
-    @property
-    def nationality(self) -> str:
-        """Derive nationality from voice_id[0]."""
-        if self._lang_code == "cmn":
-            return "Chinese"
-        return VOICE_LANG_META.get(self.voice_id[0], ("en-us", ""))[1]
-
-    @property
-    def nationality_article(self) -> str:
-        """Compute article (a/an) based on nationality's first letter."""
-        return get_article(self.nationality)
-
-    @property
-    def greeting(self) -> str:
-        """Get the language-appropriate greeting template."""
-        # For CosyVoice, use 'z' prefix for Chinese greeting
-        if self._lang_code == "cmn":
-            return get_greeting_for_lang("z")
-        return get_greeting_for_lang(self.voice_id[0])
-
-    @property
-    def model(self) -> str:
-        """Return the TTS model used for this voice."""
-        if self.voice_id.startswith("cosyvoice_"):
-            return "CosyVoice"
-        return "Kokoro"
-
-    @property
-    def ref_audio(self) -> str:
-        """Return the reference audio path for CosyVoice cloning."""
-        return self._ref_audio
+    # Derived fields, filled in by __post_init__
+    name: str = field(init=False)  # e.g., 'af_heart' -> 'Heart'
+    gender: str = field(init=False)  # voice_id[1]: 'f'=Female, 'm'=Male
+    lang_code: str = field(init=False)
+    nationality: str = field(init=False)
+    nationality_article: str = field(init=False)  # a/an for nationality
+    greeting: str = field(init=False)  # Language-appropriate greeting template
+    default_text: str = field(init=False)  # greeting with placeholders filled in
+    model: str = field(init=False)  # TTS model used for this voice
+    ref_audio: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        prefix = self.voice_id[0]
+        lang_meta = VOICE_LANG_META.get(prefix, ("en-us", ""))
+        is_cosyvoice_chinese = self._lang_code == "cmn"
+        nationality = "Chinese" if is_cosyvoice_chinese else lang_meta[1]
+
+        derived = {
+            "name": self._name or self.voice_id.split("_", 1)[1].title(),
+            "gender": self._gender or ("Female" if self.voice_id[1] == "f" else "Male"),
+            "lang_code": self._lang_code or lang_meta[0],
+            "nationality": nationality,
+            "nationality_article": get_article(nationality),
+            # For CosyVoice, use 'z' prefix for Chinese greeting
+            "greeting": get_greeting_for_lang("z" if is_cosyvoice_chinese else prefix),
+            "model": "CosyVoice" if self.voice_id.startswith("cosyvoice_") else "Kokoro",
+            "ref_audio": self._ref_audio,
+        }
+        for attr, value in derived.items():
+            object.__setattr__(self, attr, value)
+        default_text = _PLACEHOLDER_PATTERN.sub(lambda m: getattr(self, m[1]), self.greeting)
+        object.__setattr__(self, "default_text", default_text)
 
 
 def V(voice_id: str, notes: str = "", name: str = "", gender: str = "", lang_code: str = "", ref_audio: str = "") -> Voice:
@@ -246,36 +246,220 @@ LANGUAGES = [
     ]),
 ]
 
+# Per-language lookups built once, so UI handlers index instead of unpacking
+LANG_META = [
+    {
+        "name": lang_name,
+        "code": lang_code,
+        "voices": voices,
+        "rows": [(v.voice_id, v.name, v.gender, v.model, v.notes) for v in voices],
+    }
+    for lang_name, lang_code, voices in LANGUAGES
+]
+LANG_OPTIONS = [(meta["name"], i) for i, meta in enumerate(LANG_META)]
+
+
+@lru_cache(maxsize=256)
+def render_text(template: str, voice: Voice) -> str:
+    """Fill a text template's placeholders from the voice's properties."""
+    return _PLACEHOLDER_PATTERN.sub(lambda m: getattr(voice, m[1]), template)
+
 
 # =============================================================================
 # Audio Functions
 # =============================================================================
 
-def stop_audio():
-    """Stop any currently playing audio."""
-    subprocess.run(['killall', 'afplay'], stderr=subprocess.DEVNULL)
+# Absolute path so Popen can take its posix_spawn fast path. Our own fds are
+# non-inheritable (PEP 446), so close_fds=False doesn't leak them.
+_AFPLAY = shutil.which("afplay") or "/usr/bin/afplay"
 
 
 def play_audio_file(wav_path: str) -> subprocess.Popen:
     """Start playing audio, return process handle."""
     return subprocess.Popen(
-        ['afplay', wav_path],
+        [_AFPLAY, wav_path],
         stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL
+        stderr=subprocess.DEVNULL,
+        close_fds=False,  # with an absolute path, lets Popen use posix_spawn
     )
 
 
-def generate_audio(text: str, voice_id: str, lang_code: str, ref_audio: str = "") -> str:
-    """Generate TTS audio and return temp file path."""
+# sox's play or ffplay read raw PCM from stdin, so audio never touches the
+# disk. (sounddevice would avoid the subprocess, but PortAudio conflicts with
+# Textual's event loop - see docs/plans/stt-demo-wip.md.)
+_SOX_PLAY = shutil.which("play")
+_FFPLAY = shutil.which("ffplay")
+# With neither, samples go through one reused WAV for afplay
+_SCRATCH_PATH = os.path.join(tempfile.gettempdir(), f"kokoro_demo_{os.getpid()}.wav")
+# A raw-PCM player started ahead of time and idling on stdin, so the next
+# clip skips process and audio-device startup: (sample_rate, process)
+_spare_player: tuple[int, subprocess.Popen] | None = None
+_spare_lock = threading.Lock()
+
+
+def play_stream(
+    chunks: Iterator[tuple[np.ndarray, int]], on_error: Callable[[Exception], None] | None = None
+) -> subprocess.Popen:
+    """
+    Start playing as soon as the first chunk is ready, return process handle.
+
+    Later chunks are fed to the player as they arrive. All chunks must share
+    the first chunk's sample rate. If producing a later chunk fails, the
+    player ends after what it already has and on_error gets the exception.
+    """
+    samples, sample_rate = next(chunks)
+    cmd = _raw_player_cmd(sample_rate)
+    if cmd is None:
+        rest = [more for more, _ in chunks]
+        write_pcm16(_SCRATCH_PATH, np.concatenate([samples, *rest]), sample_rate)
+        return play_audio_file(_SCRATCH_PATH)
+    proc = _take_player(sample_rate)
+    pcm_chunks = itertools.chain([samples], (more for more, _ in chunks))
+    # The pipe drains at playback speed, so feed it off the UI thread
+    threading.Thread(target=_feed_player, args=(proc, pcm_chunks, on_error), daemon=True).start()
+    return proc
+
+
+def _raw_player_cmd(sample_rate: int) -> list[str] | None:
+    """Command that plays mono float32 PCM from stdin, or None if no player is installed."""
+    if _SOX_PLAY:
+        return [_SOX_PLAY, '-q', '-t', 'raw', '-r', str(sample_rate),
+                '-e', 'floating-point', '-b', '32', '-c', '1', '-']
+    if _FFPLAY:
+        # Raw PCM demuxers default to mono
+        return [_FFPLAY, '-nodisp', '-autoexit', '-loglevel', 'quiet',
+                '-f', 'f32le', '-sample_rate', str(sample_rate), '-i', '-']
+    return None
+
+
+def _start_raw_player(sample_rate: int) -> subprocess.Popen:
+    """Start a raw-PCM player waiting on stdin (requires _raw_player_cmd to succeed)."""
+    return subprocess.Popen(
+        _raw_player_cmd(sample_rate),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,  # posix_spawn, as for afplay
+    )
+
+
+def _take_player(sample_rate: int) -> subprocess.Popen:
+    """Return a raw-PCM player, using the spare if it matches, and start a new spare."""
+    global _spare_player
+    with _spare_lock:
+        spare, _spare_player = _spare_player, None
+    if spare and spare[0] == sample_rate and spare[1].poll() is None:
+        proc = spare[1]
+    else:
+        if spare:
+            spare[1].kill()
+        proc = _start_raw_player(sample_rate)
+    threading.Thread(target=_refill_spare, args=(sample_rate,), daemon=True).start()
+    return proc
+
+
+def _refill_spare(sample_rate: int) -> None:
+    """Start a spare player unless one already exists."""
+    global _spare_player
+    proc = _start_raw_player(sample_rate)
+    with _spare_lock:
+        if _spare_player is None:
+            _spare_player, proc = (sample_rate, proc), None
+    if proc is not None:
+        proc.kill()
+
+
+def release_players() -> None:
+    """Stop the spare player and delete the afplay fallback's scratch WAV."""
+    global _spare_player
+    with _spare_lock:
+        spare, _spare_player = _spare_player, None
+    if spare:
+        spare[1].kill()
+    if os.path.exists(_SCRATCH_PATH):
+        os.unlink(_SCRATCH_PATH)
+
+
+def _feed_player(
+    proc: subprocess.Popen, pcm_chunks: Iterator[np.ndarray], on_error: Callable[[Exception], None] | None
+) -> None:
+    """Write PCM chunks to a player's stdin, then close it so it exits when done."""
+    try:
+        for samples in pcm_chunks:
+            pcm = np.ascontiguousarray(samples, dtype=np.float32).reshape(-1)
+            try:
+                proc.stdin.write(memoryview(pcm).cast("B"))
+                proc.stdin.flush()
+            except (BrokenPipeError, ValueError):
+                return  # Player was stopped mid-stream
+            if proc.poll() is not None:
+                return  # Stopped; don't synthesize the rest
+    except Exception as e:
+        # Synthesizing a later sentence failed; play what we have
+        if on_error is not None:
+            on_error(e)
+    finally:
+        try:
+            proc.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+
+def write_pcm16(path, samples: np.ndarray, sample_rate: int) -> None:
+    """Write mono samples as a 16-bit PCM WAV (half the size of float32)."""
+    if samples.dtype != np.int16:
+        samples = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2')
+    pcm = np.ascontiguousarray(samples.reshape(-1), dtype='<i2')
+    n_bytes = pcm.nbytes
+    # Fixed format, so pack the 44-byte header directly instead of libsndfile
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n_bytes, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,  # PCM, mono, 16-bit
+        b"data", n_bytes,
+    )
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(memoryview(pcm).cast("B"))
+
+
+def prefetch_audio(text: str, voice_id: str, lang_code: str, ref_audio: str = "") -> None:
+    """
+    Generate audio ahead of time so a later generate_audio call is instant.
+
+    CosyVoice voices are skipped unless its daemon is already up: without it,
+    synthesis would start the daemon or load the model in a subprocess.
+    """
     import tts
 
-    # Use the lang_code directly - tts.py handles espeak-ng codes
-    samples, sample_rate = tts.synthesize(text, voice=voice_id, lang=lang_code, ref_audio=ref_audio)
+    if voice_id.startswith("cosyvoice_") and not tts._is_cosyvoice_daemon_running():
+        return
+    for _ in generate_audio(text, voice_id, lang_code, ref_audio):
+        pass
 
-    fd, tmp_path = tempfile.mkstemp(suffix='.wav')
-    os.close(fd)
-    sf.write(tmp_path, samples, sample_rate)
-    return tmp_path
+
+def generate_audio(text: str, voice_id: str, lang_code: str, ref_audio: str = "") -> Iterator[tuple[np.ndarray, int]]:
+    """
+    Yield (samples, sample_rate) a sentence at a time.
+
+    Sentences go through tts's disk cache, which also makes a play wait for
+    a prefetch of the same sentence instead of synthesizing it twice.
+    """
+    import tts
+
+    for sentence in tts.split_for_voice(text, voice_id):
+        yield _load_sentence(sentence, voice_id, lang_code, ref_audio)
+
+
+@lru_cache(maxsize=64)
+def _load_sentence(sentence: str, voice_id: str, lang_code: str, ref_audio: str) -> tuple[np.ndarray, int]:
+    """Synthesize or read back one sentence, keeping recent ones decoded for replays."""
+    import tts
+
+    # Use the lang_code directly - tts.py handles espeak-ng codes
+    samples, sample_rate = tts.synthesize_cached(sentence, voice=voice_id, lang=lang_code, ref_audio=ref_audio)
+    samples.flags.writeable = False  # Shared between replays
+    return samples, sample_rate
 
 
 # =============================================================================
@@ -354,9 +538,23 @@ class VoiceDemoApp(App):
         super().__init__()
         self.lang_idx = 0
         self.audio_proc = None
-        self.tmp_path = None
         self.paused = False
-        self.played = set()  # Track played (lang_idx, voice_idx)
+        self._input_timer = None  # Pending _maybe_restore_default
+        # Played flags, one byte per voice, indexed [lang_idx][voice_idx]
+        self.played = [bytearray(len(meta["voices"])) for meta in LANG_META]
+
+    # Widgets looked up once, on first use after mount
+    @cached_property
+    def _voice_table(self) -> DataTable:
+        return self.query_one("#voice-table", DataTable)
+
+    @cached_property
+    def _status_widget(self) -> Static:
+        return self.query_one("#status", Static)
+
+    @cached_property
+    def _text_input(self) -> Input:
+        return self.query_one("#text-input", Input)
 
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
@@ -370,8 +568,7 @@ class VoiceDemoApp(App):
 
             # Language selector and status
             with Horizontal(id="controls-row"):
-                lang_options = [(name, i) for i, (name, _, _) in enumerate(LANGUAGES)]
-                yield Select(lang_options, value=0, id="lang-select")
+                yield Select(LANG_OPTIONS, value=0, id="lang-select")
                 yield Static("", id="status")
 
             # Voice table
@@ -384,104 +581,156 @@ class VoiceDemoApp(App):
         self.title = "Kokoro TTS Voice Demo"
         self.sub_title = "Tab to switch focus | Enter to play"
 
-        table = self.query_one("#voice-table", DataTable)
-        table.add_columns("Voice ID", "Name", "Gender", "Model", "Notes", "Played")
+        table = self._voice_table
+        table.add_columns("Voice ID", "Name", "Gender", "Model", "Notes")
+        table.add_column("Played", key="played")
         self._populate_voices()
 
         # Focus the table by default
         table.focus()
 
-        # Start playing the first voice
+        # Start playing the first voice, and render the rest of its language
         self.set_timer(0.5, self._play_current)
+        self._prefetch_language(self.lang_idx)
 
     def _populate_voices(self) -> None:
         """Fill the voice table with current language's voices."""
-        table = self.query_one("#voice-table", DataTable)
+        table = self._voice_table
         table.clear()
 
-        _, lang_code, voices = LANGUAGES[self.lang_idx]
-        for i, voice in enumerate(voices):
-            played_mark = "✓" if (self.lang_idx, i) in self.played else ""
-            table.add_row(voice.voice_id, voice.name, voice.gender, voice.model, voice.notes, played_mark, key=str(i))
+        played = self.played[self.lang_idx]
+        for i, row in enumerate(LANG_META[self.lang_idx]["rows"]):
+            played_mark = "✓" if played[i] else ""
+            table.add_row(*row, played_mark, key=str(i))
 
     def _update_status(self, text: str) -> None:
         """Update the status display."""
-        status = self.query_one("#status", Static)
-        status.update(text)
+        self._status_widget.update(text)
 
     def _get_current_selection(self) -> tuple[Voice, str, int]:
         """Get current voice info: (Voice, lang_code, row_idx)."""
-        table = self.query_one("#voice-table", DataTable)
-        _, lang_code, voices = LANGUAGES[self.lang_idx]
+        table = self._voice_table
+        meta = LANG_META[self.lang_idx]
+        voices = meta["voices"]
 
         row_idx = table.cursor_row
         if row_idx < 0 or row_idx >= len(voices):
             row_idx = 0
 
-        return voices[row_idx], lang_code, row_idx
+        return voices[row_idx], meta["code"], row_idx
 
     def _get_text_to_speak(self) -> str:
         """Get the text to speak, with placeholders filled in."""
-        text_input = self.query_one("#text-input", Input)
         voice, _, _ = self._get_current_selection()
+        return self._render_text(voice)
 
-        text = text_input.value
-
-        # Replace placeholders using Voice properties
-        text = text.replace("{name}", voice.name)
-        text = text.replace("{nationality_article}", voice.nationality_article)
-        text = text.replace("{nationality}", voice.nationality)
-        text = text.replace("{gender}", voice.gender)
-        text = text.replace("{notes}", voice.notes)
-
-        return text
+    def _render_text(self, voice: Voice) -> str:
+        """Fill the text input's placeholders for the given voice."""
+        return render_text(self._text_input.value, voice)
 
     def _cleanup_audio(self) -> None:
-        """Clean up audio process and temp file."""
+        """Stop the audio process."""
         if self.audio_proc:
-            self.audio_proc.terminate()
+            if self.audio_proc.poll() is None:
+                self.audio_proc.terminate()
             self.audio_proc = None
-        if self.tmp_path and os.path.exists(self.tmp_path):
-            os.unlink(self.tmp_path)
-            self.tmp_path = None
 
     @work(exclusive=True, thread=True)
-    def _generate_and_play(self, text: str, voice_id: str, lang_code: str, ref_audio: str = "") -> str:
-        """Generate audio in background thread."""
-        return generate_audio(text, voice_id, lang_code, ref_audio)
+    def _generate_and_play(self, text: str, voice_id: str, lang_code: str, ref_audio: str = "") -> subprocess.Popen:
+        """Generate audio in background thread, starting playback with the first sentence."""
+        proc = play_stream(
+            generate_audio(text, voice_id, lang_code, ref_audio),
+            on_error=lambda e: self.call_from_thread(self._on_stream_error, e),
+        )
+        if get_current_worker().is_cancelled:
+            # Superseded while synthesizing; the result will never be played
+            proc.terminate()
+        return proc
+
+    @work(exclusive=True, thread=True, group="prefetch")
+    def _prefetch_next(self, upcoming: list[tuple[str, str, str, str]]) -> None:
+        """Generate audio for upcoming voices in the background, stopping if superseded."""
+        worker = get_current_worker()
+        for text, voice_id, lang_code, ref_audio in upcoming:
+            if worker.is_cancelled:
+                return
+            prefetch_audio(text, voice_id, lang_code, ref_audio)
+
+    @work(exclusive=True, thread=True, group="prefetch-language")
+    def _prefetch_language(self, lang_idx: int) -> None:
+        """Generate audio for every voice in a language, stopping if superseded."""
+        worker = get_current_worker()
+        for voice in LANG_META[lang_idx]["voices"]:
+            if worker.is_cancelled:
+                return
+            text = self.call_from_thread(self._render_text, voice)
+            prefetch_audio(text, voice.voice_id, voice.lang_code, voice.ref_audio)
+
+    def _queue_prefetch(self, row_idx: int, n: int = PREFETCH_COUNT) -> None:
+        """Prefetch the voices likely to play after row_idx.
+
+        In priority order: the n voices auto-advance plays next, the previous
+        voice (k), and the next language's first voice with its own greeting.
+        """
+        voices = LANG_META[self.lang_idx]["voices"]
+        rows = [(row_idx + offset) % len(voices) for offset in range(1, min(n, len(voices) - 1) + 1)]
+        prev_row = (row_idx - 1) % len(voices)
+        if prev_row != row_idx and prev_row not in rows:
+            rows.append(prev_row)
+        upcoming = []
+        for i in rows:
+            voice = voices[i]
+            upcoming.append((self._render_text(voice), voice.voice_id, voice.lang_code, voice.ref_audio))
+        next_voices = LANG_META[(self.lang_idx + 1) % len(LANG_META)]["voices"]
+        if next_voices:
+            voice = next_voices[0]
+            upcoming.append((voice.default_text, voice.voice_id, voice.lang_code, voice.ref_audio))
+        if upcoming:
+            self._prefetch_next(upcoming)
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle audio generation completion."""
+        if event.worker.group != "default":
+            return  # Only _generate_and_play results are played
         if event.state == WorkerState.SUCCESS:
-            self.tmp_path = event.worker.result
-            stop_audio()
-            self.audio_proc = play_audio_file(self.tmp_path)
+            self._cleanup_audio()
+            self.audio_proc = event.worker.result
             # Show CosyVoice indicator
-            voice, _, _ = self._get_current_selection()
+            voice, _, row_idx = self._get_current_selection()
             if voice.voice_id.startswith("cosyvoice_"):
                 self._update_status("▶ Playing (CosyVoice)...")
             else:
                 self._update_status("▶ Playing...")
-            # Start polling for audio completion
-            self.set_timer(0.5, self._check_audio_finished)
+            # Synthesize what's next while this plays, once the model is free
+            self._queue_prefetch(row_idx)
+            # Wait for playback to finish off the UI thread
+            self._await_audio(self.audio_proc)
         elif event.state == WorkerState.ERROR:
             self._update_status("Error generating audio")
 
-    def _check_audio_finished(self) -> None:
-        """Poll for audio playback completion."""
-        if self.audio_proc and self.audio_proc.poll() is not None:
-            self.audio_proc = None
-            self._update_status("")
-            if not self.paused:
-                self._advance_and_play()
-        elif self.audio_proc:
-            # Keep polling
-            self.set_timer(0.3, self._check_audio_finished)
+    def _on_stream_error(self, error: Exception) -> None:
+        """Report a sentence that failed to synthesize after playback started."""
+        self.notify(f"Error generating audio: {error}", severity="error")
+
+    @work(thread=True, group="playback")
+    def _await_audio(self, proc: subprocess.Popen) -> None:
+        """Block until the player exits, then notify the UI."""
+        proc.wait()
+        self.call_from_thread(self._on_audio_done, proc)
+
+    def _on_audio_done(self, proc: subprocess.Popen) -> None:
+        """Advance after playback finishes (ignored if it was stopped or replaced)."""
+        if proc is not self.audio_proc:
+            return
+        self.audio_proc = None
+        self._update_status("")
+        if not self.paused:
+            self._advance_and_play()
 
     def _advance_and_play(self) -> None:
         """Move to next voice and play."""
-        table = self.query_one("#voice-table", DataTable)
-        _, _, voices = LANGUAGES[self.lang_idx]
+        table = self._voice_table
+        voices = LANG_META[self.lang_idx]["voices"]
 
         next_row = (table.cursor_row + 1) % len(voices)
         table.move_cursor(row=next_row)
@@ -490,18 +739,15 @@ class VoiceDemoApp(App):
     def _play_current(self) -> None:
         """Play the currently selected voice."""
         self._cleanup_audio()
-        stop_audio()
 
         voice, _, row_idx = self._get_current_selection()
         text = self._get_text_to_speak()
 
-        # Mark as played
-        self.played.add((self.lang_idx, row_idx))
-        self._populate_voices()  # Refresh to show checkmark
-
-        # Restore cursor position
-        table = self.query_one("#voice-table", DataTable)
-        table.move_cursor(row=row_idx)
+        # Mark as played, flipping just this row's checkmark cell
+        played = self.played[self.lang_idx]
+        if not played[row_idx]:
+            played[row_idx] = 1
+            self._voice_table.update_cell(str(row_idx), "played", "✓")
 
         # Show CosyVoice indicator
         if voice.voice_id.startswith("cosyvoice_"):
@@ -520,13 +766,13 @@ class VoiceDemoApp(App):
             self.lang_idx = event.value
             self._populate_voices()
             self._cleanup_audio()
-            stop_audio()
             self._update_status("")
             # Update text input with language-appropriate greeting
-            _, _, voices = LANGUAGES[self.lang_idx]
+            voices = LANG_META[self.lang_idx]["voices"]
             if voices:
-                text_input = self.query_one("#text-input", Input)
-                text_input.value = voices[0].greeting
+                self._text_input.value = voices[0].greeting
+            # Users usually listen through the whole language, so render it all
+            self._prefetch_language(self.lang_idx)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle voice selection (Enter key on table)."""
@@ -539,13 +785,23 @@ class VoiceDemoApp(App):
         self._play_current()
 
     def on_input_changed(self, event: Input.Changed) -> None:
+        """Debounce edits: check for a cleared input once typing pauses."""
+        if event.input.id != "text-input":
+            return
+        if self._input_timer is not None:
+            self._input_timer.stop()
+        self._input_timer = self.set_timer(INPUT_DEBOUNCE_SECONDS, self._maybe_restore_default)
+
+    def _maybe_restore_default(self) -> None:
         """Restore language-appropriate default text if input is cleared."""
-        if event.input.id == "text-input" and event.value == "":
-            _, _, voices = LANGUAGES[self.lang_idx]
+        self._input_timer = None
+        text_input = self._text_input
+        if text_input.value == "":
+            voices = LANG_META[self.lang_idx]["voices"]
             if voices:
-                event.input.value = voices[0].greeting
+                text_input.value = voices[0].greeting
             else:
-                event.input.value = DEFAULT_TEXT
+                text_input.value = DEFAULT_TEXT
 
     # -------------------------------------------------------------------------
     # Actions
@@ -555,7 +811,6 @@ class VoiceDemoApp(App):
         """Toggle pause/resume auto-advance."""
         self.paused = not self.paused
         if self.paused:
-            stop_audio()
             self._cleanup_audio()
             self._update_status("[PAUSED]")
         else:
@@ -569,24 +824,36 @@ class VoiceDemoApp(App):
 
     def action_cursor_down(self) -> None:
         """Move cursor down in voice table (j key)."""
-        table = self.query_one("#voice-table", DataTable)
+        table = self._voice_table
         if self.screen.focused == table:
             table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up in voice table (k key)."""
-        table = self.query_one("#voice-table", DataTable)
+        table = self._voice_table
         if self.screen.focused == table:
             table.action_cursor_up()
 
     def action_quit(self) -> None:
         """Clean up and quit."""
         self._cleanup_audio()
-        stop_audio()
+        release_players()
         self.exit()
 
 
+def _warm_up() -> None:
+    """Trim the audio cache and load the TTS model (run in a background thread)."""
+    import tts
+    tts.trim_cache()
+    try:
+        tts.warm_up()
+    except Exception:
+        pass  # The same error surfaces on the first play
+
+
 def main():
+    # Load the model while Textual starts up, not on the first play
+    threading.Thread(target=_warm_up, daemon=True).start()
     app = VoiceDemoApp()
     app.run()
     return 0
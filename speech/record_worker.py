@@ -24,14 +24,15 @@ def main():
     # -i ":N": audio device N (colon prefix means audio-only)
     # -ar: sample rate
     # -ac: channels (1 = mono)
-    # -f: output format (raw 32-bit float)
+    # -f: output format (raw 16-bit PCM)
     cmd = [
         "ffmpeg",
+        "-nostdin",  # stopped by signal, not by 'q' on stdin
         "-f", "avfoundation",
         "-i", f":{device_index}",
         "-ar", str(SAMPLE_RATE),
         "-ac", "1",
-        "-f", "f32le",  # raw 32-bit float, little-endian
+        "-f", "s16le",  # raw 16-bit PCM, little-endian (plenty for speech)
         "-y",  # overwrite
         output_file
     ]
@@ -39,18 +40,18 @@ def main():
     # Start ffmpeg
     proc = subprocess.Popen(
         cmd,
-        stdin=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
 
     def handle_signal(sig, frame):
-        # Send 'q' to ffmpeg to quit gracefully
+        # SIGINT makes ffmpeg flush its output and quit gracefully
+        proc.send_signal(signal.SIGINT)
         try:
-            proc.stdin.write(b"q")
-            proc.stdin.flush()
-        except:
-            proc.terminate()
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
         sys.exit(0)
 
     signal.signal(signal.SIGTERM, handle_signal)
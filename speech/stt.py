@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
 import sys
+import threading
+
+import numpy as np
+
+SAMPLE_RATE = 16000  # Whisper's input rate
 
 # Lazy import for testing - allows module to be imported without faster_whisper installed
 WhisperModel = None
@@ -13,10 +18,49 @@ def _get_whisper_model_class():
     return WhisperModel
 
 
+# Loaded models, keyed by (size, device, compute_type); loading takes seconds
+_models = {}
+_models_lock = threading.Lock()
+
+
+def get_model(size: str = "large-v3", device: str = "auto", compute_type: str = "int8"):
+    """Return a loaded WhisperModel, reusing it across calls."""
+    key = (size, device, compute_type)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                model_cls = WhisperModel or _get_whisper_model_class()
+                model = _models[key] = model_cls(size, device=device, compute_type=compute_type)
+    return model
+
+
+# Batched pipelines over the shared models, same keys as _models
+_batched = {}
+
+
+def get_batched_model(size: str = "large-v3", device: str = "auto", compute_type: str = "int8"):
+    """Return a BatchedInferencePipeline over get_model's model, for long audio."""
+    key = (size, device, compute_type)
+    batched = _batched.get(key)
+    if batched is None:
+        from faster_whisper import BatchedInferencePipeline
+        model = get_model(size, device=device, compute_type=compute_type)
+        batched = _batched.setdefault(key, BatchedInferencePipeline(model=model))
+    return batched
+
+
+def warm_up(size: str = "large-v3", device: str = "auto", compute_type: str = "int8") -> None:
+    """Load a model and decode one second of silence, so the first real call is fast."""
+    segments, _ = get_model(size, device=device, compute_type=compute_type).transcribe(
+        np.zeros(SAMPLE_RATE, dtype=np.float32))
+    list(segments)  # Decoding is lazy
+
+
 def transcribe_to_file(audio_path: str, out_path: str) -> str:
     # "large-v3" is excellent quality. int8 reduces memory.
-    model_cls = WhisperModel or _get_whisper_model_class()
-    model = model_cls("large-v3", device="auto", compute_type="int8")
+    model = get_model("large-v3", device="auto", compute_type="int8")
     segments, info = model.transcribe(audio_path, vad_filter=True)
 
     lines = []
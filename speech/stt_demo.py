@@ -25,6 +25,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -38,10 +39,14 @@ import soundfile as sf
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Horizontal, Vertical, ScrollableContainer
-from textual.widgets import Footer, Header, Label, Select, Static, DataTable, ProgressBar
+from textual.containers import Horizontal, Vertical
+from textual.widgets import Footer, Header, Label, Select, Static, DataTable
+from textual.timer import Timer
 from textual.worker import Worker, WorkerState
 
+from common import format_time, get_input_devices, play_audio_file
+from stt import get_batched_model, get_model, warm_up
+
 
 # =============================================================================
 # Audio Recording via Subprocess (completely isolated from Textual)
@@ -51,24 +56,12 @@ from textual.worker import Worker, WorkerState
 _WORKER_SCRIPT = Path(__file__).parent / "record_worker.py"
 
 
-def _get_input_devices_sync() -> list:
-    """Get input devices (must be called before Textual starts)."""
-    import sounddevice as sd
-    devices = []
-    try:
-        all_devices = sd.query_devices()
-        default_input = sd.default.device[0]
-        for i, d in enumerate(all_devices):
-            if d['max_input_channels'] > 0:
-                is_default = (i == default_input)
-                devices.append((i, d['name'], is_default))
-    except Exception:
-        pass
-    return devices
-
-
 # Query devices BEFORE Textual starts (avoids event loop conflicts)
-_AVAILABLE_MICS = _get_input_devices_sync()
+_AVAILABLE_MICS = get_input_devices()
+# Mic selector options, built once: (label, device index), -1 = system default
+_MIC_OPTIONS = [("Default Microphone", -1)] + [
+    (f"{'* ' if is_default else ''}{name}", idx) for idx, name, is_default in _AVAILABLE_MICS
+]
 
 
 # =============================================================================
@@ -79,7 +72,16 @@ SAMPLE_RATE = 16000  # 16kHz for speech recognition
 CHANNELS = 1  # Mono
 WAVEFORM_WIDTH = 70  # Characters for waveform display
 WAVEFORM_CHARS = " ▁▂▃▄▅▆▇█"
+WAVEFORM_BLOCK = 160  # Samples (10 ms) per energy block behind the waveform
 LIVE_TRANSCRIBE_INTERVAL = 3.0  # Seconds between live transcriptions
+BATCHED_MIN_SECONDS = 15.0  # Longer clips are transcribed in batched VAD chunks
+
+# Pre-styled waveform glyphs, so rendering is a table lookup per column
+_PLAY_MARKER = "\033[1;33m▼\033[0m"
+_GLYPHS_SELECTED = [f"\033[1;36m{c}\033[0m" for c in WAVEFORM_CHARS]
+_GLYPHS_DIM = [f"\033[2m{c}\033[0m" for c in WAVEFORM_CHARS]
+_GLYPHS_NORMAL = [f"\033[1;32m{c}\033[0m" for c in WAVEFORM_CHARS]
+_GLYPH_STYLES = (_GLYPHS_NORMAL, _GLYPHS_SELECTED, _GLYPHS_DIM, [_PLAY_MARKER] * len(WAVEFORM_CHARS))
 
 
 # =============================================================================
@@ -98,10 +100,46 @@ class TranscriptSegment:
         return self.end_time - self.start_time
 
 
+def _block_energy(samples: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sum of squares per WAVEFORM_BLOCK samples, plus the leftover partial block."""
+    n = len(samples) // WAVEFORM_BLOCK * WAVEFORM_BLOCK
+    blocks = samples[:n].reshape(-1, WAVEFORM_BLOCK)
+    # (accumulate in float32: int16 recordings would overflow their own dtype)
+    return np.einsum("ij,ij->i", blocks, blocks, dtype=np.float32), samples[n:].copy()
+
+
+class _GrowableArray:
+    """Append-only 1-D array with capacity doubling, so view() never copies."""
+
+    def __init__(self, initial: np.ndarray, capacity: int = 0):
+        self._buf = np.empty(max(capacity, len(initial)), dtype=initial.dtype)
+        self._buf[:len(initial)] = initial
+        self._len = len(initial)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, data: np.ndarray) -> None:
+        end = self._len + len(data)
+        if end > len(self._buf):
+            grown = np.empty(max(end, 2 * len(self._buf)), dtype=self._buf.dtype)
+            grown[:self._len] = self._buf[:self._len]
+            self._buf = grown
+        self._buf[self._len:end] = data
+        self._len = end
+
+    def view(self) -> np.ndarray:
+        # Later appends only write past this view's end, so it stays valid
+        return self._buf[:self._len]
+
+
+# A minute of audio before the first regrowth
+_INITIAL_CAPACITY = SAMPLE_RATE * 60
+
+
 @dataclass
 class AudioBuffer:
     """Holds recorded audio data and editing state."""
-    samples: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float32))
     sample_rate: int = SAMPLE_RATE
 
     # Selection markers (in samples)
@@ -114,15 +152,44 @@ class AudioBuffer:
     # Currently selected segment index
     selected_segment: int = -1
 
+    # Recorded 16-bit PCM, in a preallocated buffer (concatenating on each
+    # append would copy the whole recording every time)
+    _samples: _GrowableArray = field(
+        default_factory=lambda: _GrowableArray(np.array([], dtype=np.int16), _INITIAL_CAPACITY), repr=False)
+    # Block energies for the waveform, kept up to date on append so redraws
+    # never have to scan the samples
+    _energy: _GrowableArray = field(
+        default_factory=lambda: _GrowableArray(np.array([], dtype=np.float32), _INITIAL_CAPACITY // WAVEFORM_BLOCK),
+        repr=False)
+    _energy_tail: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int16), repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """All recorded samples as one contiguous array (a view, not a copy)."""
+        with self._lock:
+            return self._samples.view()
+
+    @property
+    def block_energy(self) -> np.ndarray:
+        """Sum of squares of each complete WAVEFORM_BLOCK of samples."""
+        with self._lock:
+            return self._energy.view()
+
+    @property
+    def num_samples(self) -> int:
+        """Number of recorded samples."""
+        return len(self._samples)
+
     @property
     def duration(self) -> float:
         """Duration in seconds."""
-        return len(self.samples) / self.sample_rate if len(self.samples) > 0 else 0.0
+        return len(self._samples) / self.sample_rate
 
     @property
     def select_end_actual(self) -> int:
         """Actual selection end position (0 means end of buffer)."""
-        return self.select_end if self.select_end > 0 else len(self.samples)
+        return self.select_end if self.select_end > 0 else len(self._samples)
 
     @property
     def selected_samples(self) -> np.ndarray:
@@ -142,11 +209,23 @@ class AudioBuffer:
 
     def append(self, data: np.ndarray) -> None:
         """Append audio data to buffer."""
-        self.samples = np.concatenate([self.samples, data.flatten()])
+        data = data.reshape(-1)
+        with self._lock:
+            self._samples.append(data)
+            energy, self._energy_tail = _block_energy(np.concatenate([self._energy_tail, data]))
+            self._energy.append(energy)
+
+    def _replace_samples(self, samples: np.ndarray) -> None:
+        """Swap in a new recording."""
+        energy, tail = _block_energy(samples)
+        with self._lock:
+            self._samples = _GrowableArray(samples, _INITIAL_CAPACITY)
+            self._energy = _GrowableArray(energy, _INITIAL_CAPACITY // WAVEFORM_BLOCK)
+            self._energy_tail = tail
 
     def clear(self) -> None:
         """Clear the buffer."""
-        self.samples = np.array([], dtype=np.float32)
+        self._replace_samples(np.array([], dtype=np.int16))
         self.select_start = 0
         self.select_end = 0
         self.segments = []
@@ -154,14 +233,12 @@ class AudioBuffer:
 
     def delete_selection(self) -> None:
         """Delete audio within selection markers."""
-        if len(self.samples) == 0:
+        if len(self._samples) == 0:
             return
 
         end = self.select_end_actual
         # Keep audio before and after selection
-        before = self.samples[:self.select_start]
-        after = self.samples[end:]
-        self.samples = np.concatenate([before, after])
+        self._replace_samples(np.delete(self.samples, slice(self.select_start, end)))
 
         # Update segments - remove or adjust any that overlap
         deleted_start_sec = self.select_start / self.sample_rate
@@ -201,64 +278,47 @@ class AudioBuffer:
         return samples / self.sample_rate
 
 
-def render_waveform(samples: np.ndarray, width: int = WAVEFORM_WIDTH,
+def pcm16_to_float(samples: np.ndarray) -> np.ndarray:
+    """Scale 16-bit PCM to float32 in [-1, 1), the array input Whisper takes."""
+    out = np.empty(len(samples), dtype=np.float32)
+    np.multiply(samples, np.float32(1 / 32768), out=out)
+    return out
+
+
+def render_waveform(energy: np.ndarray, num_samples: int, width: int = WAVEFORM_WIDTH,
                     select_start: int = 0, select_end: int = 0,
                     play_pos: int = 0) -> str:
-    """Render audio samples as ASCII waveform with selection highlight."""
-    if len(samples) == 0:
+    """Render block energies (AudioBuffer.block_energy) as ASCII waveform with selection highlight."""
+    if num_samples == 0:
         return "─" * width
 
-    # Downsample to fit width
-    chunk_size = max(1, len(samples) // width)
-    chunks = []
-    for i in range(width):
-        start = i * chunk_size
-        end = min(start + chunk_size, len(samples))
-        if start < len(samples):
-            chunk = samples[start:end]
-            rms = np.sqrt(np.mean(chunk ** 2)) if len(chunk) > 0 else 0
-            chunks.append(rms)
-        else:
-            chunks.append(0)
+    # Downsample to fit width: RMS of each column's blocks in one pass
+    blocks_per_col = max(1, len(energy) // width)
+    n_cols = min(width, len(energy) // blocks_per_col)
+    chunk_size = blocks_per_col * WAVEFORM_BLOCK
+    rms = np.zeros(width)
+    col_energy = energy[:n_cols * blocks_per_col].reshape(n_cols, blocks_per_col).sum(axis=1)
+    rms[:n_cols] = np.sqrt(col_energy / chunk_size)
 
     # Normalize
-    max_amp = max(chunks) if chunks else 1
+    max_amp = rms.max()
     if max_amp > 0:
-        chunks = [c / max_amp for c in chunks]
-
-    # Convert to characters with selection highlighting
-    waveform = ""
-    select_end_actual = select_end if select_end > 0 else len(samples)
-
-    for i, amp in enumerate(chunks):
-        char_idx = int(amp * (len(WAVEFORM_CHARS) - 1))
-        char = WAVEFORM_CHARS[char_idx]
-
-        sample_pos = i * chunk_size
-
+        rms /= max_amp
+    char_idx = (rms * (len(WAVEFORM_CHARS) - 1)).astype(np.intp)
+
+    # Pick a style per column (indexes into _GLYPH_STYLES)
+    sample_pos = np.arange(width) * chunk_size
+    style = np.zeros(width, dtype=np.intp)  # No selection - normal green
+    if select_start > 0 or select_end > 0:
+        # Selection active: inside bright cyan, outside dim
+        select_end_actual = select_end if select_end > 0 else num_samples
+        inside = (sample_pos >= select_start) & (sample_pos < select_end_actual)
+        style[:] = np.where(inside, 1, 2)
+    if play_pos > 0:
         # Playback position marker
-        if play_pos > 0 and abs(sample_pos - play_pos) < chunk_size:
-            waveform += f"\033[1;33m▼\033[0m"
-        elif select_start > 0 or select_end > 0:
-            # Selection active
-            if select_start <= sample_pos < select_end_actual:
-                # Inside selection - bright cyan
-                waveform += f"\033[1;36m{char}\033[0m"
-            else:
-                # Outside selection - dim
-                waveform += f"\033[2m{char}\033[0m"
-        else:
-            # No selection - normal green
-            waveform += f"\033[1;32m{char}\033[0m"
+        style[np.abs(sample_pos - play_pos) < chunk_size] = 3
 
-    return waveform
-
-
-def format_time(seconds: float) -> str:
-    """Format seconds as MM:SS.s"""
-    mins = int(seconds // 60)
-    secs = seconds % 60
-    return f"{mins:02d}:{secs:04.1f}"
+    return "".join([_GLYPH_STYLES[st][c] for st, c in zip(style.tolist(), char_idx.tolist())])
 
 
 # =============================================================================
@@ -377,6 +437,12 @@ class STTDemoApp(App):
         self.live_transcribe_enabled = True
         self.selected_mic = None  # None = default device
         self.available_mics = _AVAILABLE_MICS  # Pre-loaded before Textual
+        self._shown_text: dict[str, str] = {}  # selector -> text last displayed
+        self._shown_rows: list[tuple[str, str, str]] = []  # Segment table rows, keyed by index
+        self._waveform_state = None  # What the waveform section last showed
+        # Display refresh intervals, running only while recording / playing
+        self._record_timer: Optional[Timer] = None
+        self._playback_timer: Optional[Timer] = None
 
         # Subprocess for recording (completely isolated from Textual)
         self.record_proc: Optional[subprocess.Popen] = None
@@ -388,12 +454,7 @@ class STTDemoApp(App):
         with Vertical(id="main-container"):
             # Controls row with mic selector
             with Horizontal(id="controls-row"):
-                # Build mic options
-                mic_options = [("Default Microphone", -1)]
-                for idx, name, is_default in self.available_mics:
-                    label = f"{'* ' if is_default else ''}{name}"
-                    mic_options.append((label, idx))
-                yield Select(mic_options, value=-1, id="mic-select", prompt="Microphone")
+                yield Select(_MIC_OPTIONS, value=-1, id="mic-select", prompt="Microphone")
                 yield Static("", id="status-label")
 
             # Waveform section
@@ -417,58 +478,78 @@ class STTDemoApp(App):
         self.sub_title = "q=Quit | Space=Record | p=Play"
 
         table = self.query_one("#segments-table", DataTable)
-        table.add_columns("Time", "Duration", "Text")
+        table.add_column("Time", key="time")
+        table.add_column("Duration", key="duration")
+        table.add_column("Text", key="text")
         table.cursor_type = "row"
 
         self._update_status("Ready. Select mic and press Space to record.")
 
     def _update_status(self, text: str, style: str = "") -> None:
         """Update the status display."""
-        status = self.query_one("#status-label", Static)
-        if style:
-            status.update(f"[{style}]{text}[/{style}]")
-        else:
-            status.update(text)
+        self._set_text("#status-label", f"[{style}]{text}[/{style}]" if style else text)
+
+    def _set_text(self, selector: str, text: str) -> None:
+        """Update a Static/Label only if its text changed, to skip needless repaints."""
+        if self._shown_text.get(selector) != text:
+            self._shown_text[selector] = text
+            self.query_one(selector, Static).update(text)
 
     def _update_waveform(self) -> None:
         """Update the waveform display."""
-        waveform_widget = self.query_one("#waveform", Static)
-        time_widget = self.query_one("#time-label", Label)
-        selection_widget = self.query_one("#selection-label", Static)
+        # Everything below is a function of this state, so skip no-op ticks
+        state = (self.audio.num_samples, self.audio.select_start, self.audio.select_end, self.play_position)
+        if state == self._waveform_state:
+            return
+        self._waveform_state = state
 
         waveform = render_waveform(
-            self.audio.samples,
+            self.audio.block_energy,
+            self.audio.num_samples,
             WAVEFORM_WIDTH,
             self.audio.select_start,
             self.audio.select_end,
             self.play_position
         )
-        waveform_widget.update(waveform)
+        self._set_text("#waveform", waveform)
 
-        time_widget.update(format_time(self.audio.duration))
+        self._set_text("#time-label", format_time(self.audio.duration))
 
         # Selection info
         if self.audio.select_start > 0 or self.audio.select_end > 0:
             start_sec = self.audio.samples_to_time(self.audio.select_start)
             end_sec = self.audio.samples_to_time(self.audio.select_end_actual)
-            selection_widget.update(
+            self._set_text(
+                "#selection-label",
                 f"Selection: {format_time(start_sec)} - {format_time(end_sec)} "
                 f"({end_sec - start_sec:.1f}s)"
             )
         else:
-            selection_widget.update("Selection: none (use [ and ] to select)")
+            self._set_text("#selection-label", "Selection: none (use [ and ] to select)")
 
     def _update_segments_table(self) -> None:
-        """Update the segments table."""
+        """Update the segments table, touching only rows that changed."""
         table = self.query_one("#segments-table", DataTable)
-        table.clear()
+        shown = self._shown_rows
 
-        for seg in self.audio.segments:
+        for i, seg in enumerate(self.audio.segments):
             time_str = format_time(seg.start_time)
             dur_str = f"{seg.duration:.1f}s"
             # Truncate long text
             text = seg.text[:60] + "..." if len(seg.text) > 60 else seg.text
-            table.add_row(time_str, dur_str, text)
+            row = (time_str, dur_str, text)
+            if i == len(shown):
+                table.add_row(*row, key=str(i))
+                shown.append(row)
+            elif shown[i] != row:
+                for column, old, new in zip(("time", "duration", "text"), shown[i], row):
+                    if old != new:
+                        table.update_cell(str(i), column, new)
+                shown[i] = row
+
+        while len(shown) > len(self.audio.segments):
+            shown.pop()
+            table.remove_row(str(len(shown)))
 
     # -------------------------------------------------------------------------
     # Recording
@@ -502,11 +583,15 @@ class STTDemoApp(App):
         )
 
         self._update_status("● Recording... Press Space to stop", "bold red")
-        self._start_recording_timer()
+        self._on_record_tick()
+        self._record_timer = self.set_interval(0.1, self._on_record_tick)
 
     def _stop_recording(self) -> None:
         """Stop recording audio."""
         self.is_recording = False
+        if self._record_timer is not None:
+            self._record_timer.stop()
+            self._record_timer = None
 
         if self.record_proc:
             # Send SIGTERM to stop gracefully
@@ -542,22 +627,18 @@ class STTDemoApp(App):
                 with open(self._record_tmp, 'rb') as f:
                     f.seek(self._record_file_pos)
                     new_data = f.read()
-                    self._record_file_pos = file_size
 
-                    # Convert to numpy array
-                    if len(new_data) >= 4:  # At least one float32
-                        # Ensure we read complete float32s
-                        usable = (len(new_data) // 4) * 4
-                        chunk = np.frombuffer(new_data[:usable], dtype=np.float32)
+                    # Convert to numpy array, leaving any partial sample for next time
+                    usable = (len(new_data) // 2) * 2
+                    self._record_file_pos += usable
+                    if usable:
+                        chunk = np.frombuffer(new_data[:usable], dtype=np.int16)
                         self.audio.append(chunk)
         except Exception:
             pass
 
-    def _start_recording_timer(self) -> None:
-        """Timer to poll file for audio data and update display."""
-        if not self.is_recording:
-            return
-
+    def _on_record_tick(self) -> None:
+        """Poll file for audio data and update display (every 0.1s while recording)."""
         # Poll file for new audio data
         self._poll_record_file()
 
@@ -565,15 +646,13 @@ class STTDemoApp(App):
         self._update_status(f"● Recording... [{format_time(elapsed)}] Press Space to stop", "bold red")
         self._update_waveform()
 
-        self.set_timer(0.1, self._start_recording_timer)
-
     # -------------------------------------------------------------------------
     # Playback (uses afplay subprocess to avoid sounddevice in main process)
     # -------------------------------------------------------------------------
 
     def _start_playback(self) -> None:
         """Start playing audio using afplay subprocess."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             self._update_status("Nothing to play. Record something first.")
             return
 
@@ -593,15 +672,16 @@ class STTDemoApp(App):
         sf.write(self._playback_tmp, samples_to_play, SAMPLE_RATE)
 
         # Start afplay subprocess
-        self._playback_proc = subprocess.Popen(
-            ['afplay', self._playback_tmp],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+        self._playback_proc = play_audio_file(self._playback_tmp)
 
         self._playback_duration = len(samples_to_play) / SAMPLE_RATE
+        self._playback_start_pos = self.play_position
+        self._playback_started_at = time.monotonic()
         self._update_status("▶ Playing...", "bold green")
-        self._start_playback_timer()
+        # Completion is signalled by the waiter; the timer only moves the cursor
+        self._await_playback(self._playback_proc)
+        self._on_playback_tick()
+        self._playback_timer = self.set_interval(0.1, self._on_playback_tick)
 
     def _stop_playback(self) -> None:
         """Stop playback."""
@@ -617,35 +697,40 @@ class STTDemoApp(App):
 
     def _cleanup_playback(self) -> None:
         """Clean up playback resources."""
+        if self._playback_timer is not None:
+            self._playback_timer.stop()
+            self._playback_timer = None
         if hasattr(self, '_playback_proc') and self._playback_proc:
             self._playback_proc = None
         if hasattr(self, '_playback_tmp') and self._playback_tmp and os.path.exists(self._playback_tmp):
             os.unlink(self._playback_tmp)
             self._playback_tmp = None
 
-    def _start_playback_timer(self) -> None:
-        """Update playback position display and check for completion."""
-        if not self.is_playing:
+    @work(thread=True, group="playback")
+    def _await_playback(self, proc: subprocess.Popen) -> None:
+        """Block until afplay exits, then notify the UI."""
+        proc.wait()
+        self.call_from_thread(self._on_playback_done, proc)
+
+    def _on_playback_done(self, proc: subprocess.Popen) -> None:
+        """Finish playback (ignored if it was stopped or replaced)."""
+        if proc is not getattr(self, '_playback_proc', None):
             return
+        self._cleanup_playback()
+        self.is_playing = False
+        self.play_position = 0
+        self._update_status(f"Playback finished. {self.audio.duration:.1f}s recorded.")
+        self._update_waveform()
 
-        # Check if playback finished
-        if hasattr(self, '_playback_proc') and self._playback_proc:
-            if self._playback_proc.poll() is not None:
-                # Playback finished
-                self._cleanup_playback()
-                self.is_playing = False
-                self.play_position = 0
-                self._update_status(f"Playback finished. {self.audio.duration:.1f}s recorded.")
-                self._update_waveform()
-                return
-
-        # Update position estimate
-        self.play_position += int(SAMPLE_RATE * 0.1)
-        end = self.audio.select_end_actual if self.audio.select_end > 0 else len(self.audio.samples)
+    def _on_playback_tick(self) -> None:
+        """Update playback position display (every 0.1s while playing)."""
+        # Position from elapsed wall time, so timer jitter doesn't accumulate
+        elapsed = time.monotonic() - self._playback_started_at
+        self.play_position = self._playback_start_pos + int(SAMPLE_RATE * elapsed)
+        end = self.audio.select_end_actual if self.audio.select_end > 0 else self.audio.num_samples
         if self.play_position > end:
             self.play_position = end
         self._update_waveform()
-        self.set_timer(0.1, self._start_playback_timer)
 
     # -------------------------------------------------------------------------
     # Transcription
@@ -654,64 +739,50 @@ class STTDemoApp(App):
     @work(exclusive=True, thread=True, group="transcribe")
     def _transcribe_audio(self, start_sample: int = 0, end_sample: int = 0) -> list:
         """Transcribe audio in background thread. Returns list of segments."""
-        import stt as stt_module
-        from faster_whisper import WhisperModel
-
         # Get samples to transcribe
         if end_sample == 0:
-            end_sample = len(self.audio.samples)
+            end_sample = self.audio.num_samples
         samples = self.audio.samples[start_sample:end_sample]
 
         if len(samples) < SAMPLE_RATE * 0.5:  # Less than 0.5 seconds
             return []
 
-        # Save to temp file
-        fd, tmp_path = tempfile.mkstemp(suffix='.wav')
-        os.close(fd)
-
-        try:
-            sf.write(tmp_path, samples, SAMPLE_RATE)
-
-            # Transcribe with timestamps
-            model = WhisperModel("large-v3", device="auto", compute_type="int8")
-            raw_segments, info = model.transcribe(tmp_path, vad_filter=True, word_timestamps=True)
-
-            # Convert to our segment format
-            segments = []
-            start_offset = start_sample / SAMPLE_RATE
-
-            for seg in raw_segments:
-                text = (seg.text or "").strip()
-                if text:
-                    segments.append(TranscriptSegment(
-                        text=text,
-                        start_time=seg.start + start_offset,
-                        end_time=seg.end + start_offset
-                    ))
+        # Transcribe with timestamps; batching only pays off past a few VAD chunks
+        if len(samples) > SAMPLE_RATE * BATCHED_MIN_SECONDS:
+            batched = get_batched_model("large-v3", device="auto", compute_type="int8")
+            raw_segments, info = batched.transcribe(
+                pcm16_to_float(samples), batch_size=8, vad_filter=True, word_timestamps=True)
+        else:
+            model = get_model("large-v3", device="auto", compute_type="int8")
+            raw_segments, info = model.transcribe(pcm16_to_float(samples), vad_filter=True, word_timestamps=True)
+
+        # Convert to our segment format
+        segments = []
+        start_offset = start_sample / SAMPLE_RATE
+
+        for seg in raw_segments:
+            text = (seg.text or "").strip()
+            if text:
+                segments.append(TranscriptSegment(
+                    text=text,
+                    start_time=seg.start + start_offset,
+                    end_time=seg.end + start_offset
+                ))
 
-            return segments
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        return segments
 
     @work(exclusive=True, thread=True, group="transcribe_live")
     def _transcribe_live(self) -> list:
         """Live transcription during recording - transcribe recent audio."""
-        if len(self.audio.samples) < SAMPLE_RATE:
+        if self.audio.num_samples < SAMPLE_RATE:
             return []
 
         # Transcribe the last few seconds
         samples = self.audio.samples[-int(SAMPLE_RATE * LIVE_TRANSCRIBE_INTERVAL * 2):]
 
-        fd, tmp_path = tempfile.mkstemp(suffix='.wav')
-        os.close(fd)
-
         try:
-            sf.write(tmp_path, samples, SAMPLE_RATE)
-
-            from faster_whisper import WhisperModel
-            model = WhisperModel("base", device="auto", compute_type="int8")  # Faster model for live
-            raw_segments, _ = model.transcribe(tmp_path, vad_filter=True)
+            model = get_model("base", device="auto", compute_type="int8")  # Faster model for live
+            raw_segments, _ = model.transcribe(pcm16_to_float(samples), vad_filter=True)
 
             # Get text only for live preview
             texts = []
@@ -723,12 +794,9 @@ class STTDemoApp(App):
             return texts
         except Exception:
             return []
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
-        """Handle transcription completion."""
+        """Handle transcription and save completion."""
         if event.worker.group == "transcribe":
             if event.state == WorkerState.SUCCESS:
                 segments = event.worker.result
@@ -742,6 +810,12 @@ class STTDemoApp(App):
             elif event.state == WorkerState.ERROR:
                 self._update_status("Transcription failed!", "bold red")
 
+        elif event.worker.group == "save":
+            if event.state == WorkerState.SUCCESS:
+                self._update_status(event.worker.result)
+            elif event.state == WorkerState.ERROR:
+                self._update_status("Save failed!", "bold red")
+
         elif event.worker.group == "transcribe_live":
             if event.state == WorkerState.SUCCESS and self.is_recording:
                 texts = event.worker.result
@@ -796,7 +870,7 @@ class STTDemoApp(App):
 
     def action_transcribe_all(self) -> None:
         """Transcribe the full recorded audio."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             self._update_status("Nothing to transcribe. Record something first.")
             return
 
@@ -810,7 +884,7 @@ class STTDemoApp(App):
 
     def action_transcribe_selection(self) -> None:
         """Transcribe only the selected region."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             self._update_status("Nothing to transcribe.")
             return
 
@@ -828,33 +902,33 @@ class STTDemoApp(App):
 
     def action_set_select_start(self) -> None:
         """Set selection start at current play position or 10% in."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             return
 
         if self.play_position > 0:
             self.audio.select_start = self.play_position
         else:
-            self.audio.select_start = int(len(self.audio.samples) * 0.1)
+            self.audio.select_start = int(self.audio.num_samples * 0.1)
 
         self._update_waveform()
         self._update_status(f"Selection start: {format_time(self.audio.samples_to_time(self.audio.select_start))}")
 
     def action_set_select_end(self) -> None:
         """Set selection end at current play position or 10% from end."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             return
 
         if self.play_position > 0:
             self.audio.select_end = self.play_position
         else:
-            self.audio.select_end = int(len(self.audio.samples) * 0.9)
+            self.audio.select_end = int(self.audio.num_samples * 0.9)
 
         self._update_waveform()
         self._update_status(f"Selection end: {format_time(self.audio.samples_to_time(self.audio.select_end))}")
 
     def action_delete_selection(self) -> None:
         """Delete selected region (audio and associated transcript segments)."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             return
 
         if self.audio.select_start == 0 and self.audio.select_end == 0:
@@ -892,7 +966,7 @@ class STTDemoApp(App):
 
     def action_save_audio(self) -> None:
         """Save audio to file."""
-        if len(self.audio.samples) == 0:
+        if self.audio.num_samples == 0:
             self._update_status("Nothing to save.")
             return
 
@@ -905,16 +979,21 @@ class STTDemoApp(App):
         else:
             samples = self.audio.samples
 
+        self._update_status("Saving...")
+        self._save_audio(out_path, samples, self.audio.full_transcript)
+
+    @work(exclusive=True, thread=True, group="save")
+    def _save_audio(self, out_path: str, samples: np.ndarray, transcript: str) -> str:
+        """Write audio (and transcript, if any) in background thread. Returns status message."""
         sf.write(out_path, samples, SAMPLE_RATE)
 
         # Also save transcript if available
-        if self.audio.segments:
+        if transcript:
             txt_path = "buffer/recording.txt"
             with open(txt_path, 'w') as f:
-                f.write(self.audio.full_transcript)
-            self._update_status(f"Saved to {out_path} and {txt_path}")
-        else:
-            self._update_status(f"Saved to {out_path}")
+                f.write(transcript)
+            return f"Saved to {out_path} and {txt_path}"
+        return f"Saved to {out_path}"
 
     def action_quit(self) -> None:
         """Clean up and quit."""
@@ -925,7 +1004,17 @@ class STTDemoApp(App):
         self.exit()
 
 
+def _warm_up() -> None:
+    """Load the transcription model (run in a background thread)."""
+    try:
+        warm_up("large-v3", device="auto", compute_type="int8")
+    except Exception:
+        pass  # The same error surfaces on the first transcription
+
+
 def main():
+    # Load the model while the user records, not on the first transcription
+    threading.Thread(target=_warm_up, daemon=True).start()
     app = STTDemoApp()
     app.run()
     return 0
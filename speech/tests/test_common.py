@@ -0,0 +1,23 @@
+import numpy as np
+import soundfile as sf
+import common
+
+
+def test_load_audio_matches_soundfile(tmp_path):
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-1.0, 1.0, 16000).astype(np.float32)
+
+    plain = tmp_path / "plain.wav"
+    sf.write(plain, samples, 16000, subtype="PCM_16")
+    # A LIST chunk before the data chunk moves the data offset
+    tagged = tmp_path / "tagged.wav"
+    with sf.SoundFile(tagged, "w", 16000, 1, subtype="PCM_16") as f:
+        f.title = "test"
+        f.write(samples)
+
+    for path in (plain, tagged):
+        expected, expected_sr = sf.read(path, dtype=np.float32)
+        loaded, sr = common.load_audio(str(path))
+        assert sr == expected_sr
+        assert loaded.dtype == np.float32
+        np.testing.assert_array_equal(loaded, expected)
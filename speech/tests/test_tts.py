@@ -1,4 +1,8 @@
+import io
+import threading
+
 import numpy as np
+import soundfile as sf
 import tts
 
 
@@ -19,4 +23,120 @@ def test_tts_writes_wav(monkeypatch, tmp_path):
     tts.tts_file(str(text_path), str(wav_path))
 
     assert wav_path.exists()
-    assert wav_path.stat().st_size > 44  # basic WAV header size
\ No newline at end of file
+    assert wav_path.stat().st_size > 44  # basic WAV header size
+
+
+def test_get_article():
+    assert tts.get_article("American") == "an"
+    assert tts.get_article("italian") == "an"
+    assert tts.get_article("British") == "a"
+    assert tts.get_article("中文") == "a"
+    assert tts.get_article("ßtraße") == "a"
+    assert tts.get_article("ﬀ") == "a"
+    assert tts.get_article("") == "a"
+
+
+class _CountingDict(dict):
+    """Counts get() calls, so a test can tell when callers have joined in."""
+
+    def __init__(self):
+        super().__init__()
+        self.gets = threading.Semaphore(0)
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        self.gets.release()
+        return value
+
+
+def _run_concurrent_cached_calls(monkeypatch, tmp_path, fake_synthesize, n=4):
+    monkeypatch.setattr(tts, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(tts, "_cache_bytes", None)
+    in_flight = _CountingDict()
+    monkeypatch.setattr(tts, "_in_flight", in_flight)
+    monkeypatch.setattr(tts, "synthesize", fake_synthesize)
+
+    results = []
+
+    def call():
+        try:
+            results.append(tts.synthesize_cached("hello", "af_heart"))
+        except Exception as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for _ in range(n):
+        assert in_flight.gets.acquire(timeout=5)  # Every caller is past the in-flight check
+    return threads, results
+
+
+def test_synthesize_cached_coalesces_concurrent_calls(monkeypatch, tmp_path):
+    calls = []
+    release = threading.Event()
+    audio = np.array([0.0, 0.25, -0.25], dtype=np.float32)
+
+    def fake_synthesize(text, voice, lang, speed, ref_audio):
+        calls.append(text)
+        release.wait(5)
+        return audio, 24000
+
+    threads, results = _run_concurrent_cached_calls(monkeypatch, tmp_path, fake_synthesize)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert calls == ["hello"]
+    assert len(results) == 4
+    for samples, sample_rate in results:
+        assert sample_rate == 24000
+        np.testing.assert_array_equal(samples, audio)
+    # Waiters get copies, so no two callers share an array
+    assert len({id(samples) for samples, _ in results}) == 4
+    assert not tts._in_flight
+
+
+def test_synthesize_cached_shares_errors(monkeypatch, tmp_path):
+    calls = []
+    release = threading.Event()
+    error = RuntimeError("synthesis failed")
+
+    def fake_synthesize(text, voice, lang, speed, ref_audio):
+        calls.append(text)
+        release.wait(5)
+        raise error
+
+    threads, results = _run_concurrent_cached_calls(monkeypatch, tmp_path, fake_synthesize)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert calls == ["hello"]
+    assert results == [error] * 4
+    assert not tts._in_flight
+
+
+def test_decode_wav_pcm16_matches_soundfile():
+    samples = np.linspace(-1.0, 1.0, 1001, dtype=np.float32)
+    buf = io.BytesIO()
+    sf.write(buf, samples, 22050, format="WAV", subtype="PCM_16")
+    wav_bytes = buf.getvalue()
+
+    decoded, sample_rate = tts._decode_wav(wav_bytes)
+    expected, expected_rate = sf.read(io.BytesIO(wav_bytes), dtype="float32")
+
+    assert sample_rate == expected_rate == 22050
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, expected)
+
+
+def test_decode_wav_falls_back_for_other_formats():
+    samples = np.linspace(-1.0, 1.0, 1001, dtype=np.float32)
+    buf = io.BytesIO()
+    sf.write(buf, samples, 16000, format="WAV", subtype="FLOAT")
+
+    decoded, sample_rate = tts._decode_wav(buf.getvalue())
+
+    assert sample_rate == 16000
+    np.testing.assert_array_equal(decoded, samples)
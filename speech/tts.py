@@ -7,11 +7,20 @@ Supports two backends:
   - "native": kokoro (requires spacy, currently broken on Python 3.13+)
 
 Set TTS_BACKEND=native to use the native backend when it becomes available.
+Set TTS_PRELOAD=1 to start loading the model in the background on import.
+Set TTS_PRECISION=fp16 or int8 to use a quantized ONNX model, if downloaded.
+Set TTS_PROVIDERS to choose ONNX Runtime providers (e.g. CoreMLExecutionProvider).
 """
+import hashlib
 import os
+import re
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -37,13 +46,22 @@ VOICE_LANG_META = {
 }
 
 
+# Bit (ord(letter) - ord('A')) is set for each vowel
+_VOWEL_MASK = sum(1 << (ord(c) - 65) for c in "AEIOU")
+
+
+@lru_cache(maxsize=256)
 def get_article(word: str) -> str:
     """Return 'an' if word starts with a vowel sound, else 'a'."""
     if not word:
         return "a"
-    return "an" if word[0].lower() in "aeiou" else "a"
+    # Fold ASCII case by hand: upper() can lengthen a character ("ß" -> "SS")
+    c = word[0]
+    idx = ord(c) - 65 if "A" <= c <= "Z" else ord(c) - 97 if "a" <= c <= "z" else -1
+    return "an" if 0 <= idx < 26 and (_VOWEL_MASK >> idx) & 1 else "a"
 
 
+@lru_cache(maxsize=256)
 def _lang_from_voice(voice: str) -> str:
     """Infer language code from voice ID (e.g., 'zf_xiaobei' -> 'cmn')."""
     if voice and len(voice) >= 1:
@@ -58,42 +76,128 @@ TTS_BACKEND = os.environ.get("TTS_BACKEND", "onnx")
 # Model paths for ONNX backend (relative to this file's directory)
 _SCRIPT_DIR = Path(__file__).parent
 _MODEL_DIR = _SCRIPT_DIR / "models"
-_ONNX_MODEL = _MODEL_DIR / "kokoro-v1.0.onnx"
+_ONNX_MODEL_FP32 = _MODEL_DIR / "kokoro-v1.0.onnx"
+# TTS_PRECISION picks a smaller model variant (less memory traffic per inference)
+_ONNX_PRECISION = os.environ.get("TTS_PRECISION", "fp32").lower()
+_ONNX_SUFFIXES = {"fp16": ".fp16", "int8": ".int8"}
+_ONNX_MODEL = _MODEL_DIR / f"kokoro-v1.0{_ONNX_SUFFIXES.get(_ONNX_PRECISION, '')}.onnx"
+if not _ONNX_MODEL.exists() and _ONNX_MODEL_FP32.exists():
+    if _ONNX_MODEL != _ONNX_MODEL_FP32:
+        print(f"WARNING: {_ONNX_MODEL.name} not found, using {_ONNX_MODEL_FP32.name}", file=sys.stderr)
+    _ONNX_MODEL = _ONNX_MODEL_FP32
 _VOICES_BIN = _MODEL_DIR / "voices-v1.0.bin"
 
+# Texts longer than this are split into sentences, synthesized in parallel
+_ONNX_CHUNK_MIN = int(os.environ.get("TTS_CHUNK_MIN", "200"))
+# ONNX threads per inference on the main session (0 = ORT's default, one
+# per physical core), which serves everything but the sentence pool
+_ONNX_INTRA_OP_THREADS = max(0, int(os.environ.get("TTS_INTRA_OP_THREADS", "0")))
+# The sentence pool has its own session with a few threads per worker, so
+# the workers together fill the cores without oversubscribing them
+_ONNX_POOL_THREADS = 2
+_ONNX_WORKERS = max(1, (os.cpu_count() or 2) // _ONNX_POOL_THREADS)
+
+# Comma-separated ONNX Runtime providers to try in order, e.g.
+# "CoreMLExecutionProvider,CPUExecutionProvider". Unset, CUDA is used when
+# available; CoreML is opt-in, since Kokoro's inputs change shape every call.
+_ONNX_PROVIDERS = [p.strip() for p in os.environ.get("TTS_PROVIDERS", "").split(",") if p.strip()]
+_ONNX_PROVIDER_OPTIONS = {"CoreMLExecutionProvider": {"ModelFormat": "MLProgram"}}
+
 # Lazy-loaded instances
 _onnx_instance = None
+_onnx_pool = None  # (Kokoro on the pool session, ThreadPoolExecutor)
 _native_pipeline = None
+# Guards the lazy loads, so a background warm_up() and a first real call
+# don't both load the model
+_load_lock = threading.Lock()
+# Serializes kokoro-onnx's front end (espeak-ng phonemization over ctypes and
+# reads from the voices npz), which isn't thread-safe; inference runs outside it
+_frontend_lock = threading.Lock()
 
 
 # -----------------------------------------------------------------------------
 # ONNX Backend (kokoro-onnx)
 # -----------------------------------------------------------------------------
 
+def _load_onnx(intra_op_threads: int):
+    """Load the Kokoro ONNX model on a new session with the given thread count."""
+    from kokoro_onnx import Kokoro
+    if not _ONNX_MODEL.exists() or not _VOICES_BIN.exists():
+        raise FileNotFoundError(
+            f"ONNX model files not found. Download them:\n"
+            f"  mkdir -p {_MODEL_DIR}\n"
+            f"  wget -P {_MODEL_DIR} https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.onnx\n"
+            f"  wget -P {_MODEL_DIR} https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/voices-v1.0.bin"
+        )
+    import onnxruntime as ort
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.enable_cpu_mem_arena = True
+    options.inter_op_num_threads = 1
+    options.intra_op_num_threads = intra_op_threads
+    session = ort.InferenceSession(str(_ONNX_MODEL), options, providers=_onnx_providers(ort))
+    return Kokoro.from_session(session, str(_VOICES_BIN))
+
+
 def _get_onnx_instance():
     """Lazy-load the Kokoro ONNX model."""
     global _onnx_instance
     if _onnx_instance is None:
-        from kokoro_onnx import Kokoro
-        if not _ONNX_MODEL.exists() or not _VOICES_BIN.exists():
-            raise FileNotFoundError(
-                f"ONNX model files not found. Download them:\n"
-                f"  mkdir -p {_MODEL_DIR}\n"
-                f"  wget -P {_MODEL_DIR} https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.onnx\n"
-                f"  wget -P {_MODEL_DIR} https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/voices-v1.0.bin"
-            )
-        _onnx_instance = Kokoro(str(_ONNX_MODEL), str(_VOICES_BIN))
+        with _load_lock:
+            if _onnx_instance is None:
+                _onnx_instance = _load_onnx(_ONNX_INTRA_OP_THREADS)
     return _onnx_instance
 
 
+def _onnx_providers(ort) -> list:
+    """Pick the execution providers for the Kokoro session, always ending with CPU."""
+    available = ort.get_available_providers()
+    wanted = _ONNX_PROVIDERS or ["CUDAExecutionProvider"]
+    providers = [(p, _ONNX_PROVIDER_OPTIONS.get(p, {})) for p in wanted
+                 if p in available and p != "CPUExecutionProvider"]
+    return providers + ["CPUExecutionProvider"]
+
+
+def _get_onnx_pool():
+    """
+    Lazy-load the sentence pool: a second Kokoro session and the threads that share it.
+
+    Loaded by preload() and warm_up(), or else on the first long text. It
+    holds a second copy of the model, because ONNX Runtime sets thread counts
+    per session, not per run.
+    """
+    global _onnx_pool
+    if _onnx_pool is None:
+        with _load_lock:
+            if _onnx_pool is None:
+                _onnx_pool = (
+                    _load_onnx(_ONNX_POOL_THREADS),
+                    ThreadPoolExecutor(max_workers=_ONNX_WORKERS, thread_name_prefix="kokoro"),
+                )
+    return _onnx_pool
+
+
 def _synthesize_onnx(text: str, voice: str = DEFAULT_VOICE, lang: str | None = None, speed: float = DEFAULT_SPEED):
     """Synthesize speech using kokoro-onnx."""
     kokoro = _get_onnx_instance()
     # Auto-detect language from voice if not specified
     if lang is None:
         lang = _lang_from_voice(voice)
-    samples, sample_rate = kokoro.create(text, voice=voice, speed=speed, lang=lang)
-    return np.asarray(samples, dtype=np.float32), sample_rate
+    sentences = split_sentences(text) if len(text) > _ONNX_CHUNK_MIN else [text]
+    with _frontend_lock:
+        style = kokoro.get_voice_style(voice)
+        phonemes = [kokoro.tokenizer.phonemize(sentence, lang) for sentence in sentences]
+    if len(phonemes) == 1:
+        samples, sample_rate = kokoro.create(phonemes[0], voice=style, speed=speed, is_phonemes=True)
+        return np.asarray(samples, dtype=np.float32), sample_rate
+
+    # ONNX Runtime releases the GIL while running, so sentences synthesize in parallel
+    pool_kokoro, executor = _get_onnx_pool()
+    results = list(executor.map(
+        lambda ps: pool_kokoro.create(ps, voice=style, speed=speed, is_phonemes=True), phonemes))
+    samples = np.concatenate([part for part, _sr in results], dtype=np.float32)
+    return samples, results[0][1]
 
 
 # -----------------------------------------------------------------------------
@@ -105,9 +209,21 @@ _COSYVOICE_DIR = _SCRIPT_DIR / "cosyvoice"
 _COSYVOICE_VENV = _COSYVOICE_DIR / ".venv"
 _COSYVOICE_MODEL = _COSYVOICE_DIR / "pretrained_models" / "CosyVoice2-0.5B"
 
+# Identifies the models behind synthesize(), for callers that cache its output
+MODEL_TAG = f"{TTS_BACKEND}:{_ONNX_MODEL.name}:{_COSYVOICE_MODEL.name}"
+
 # Daemon settings
 _COSYVOICE_DAEMON_HOST = os.environ.get("COSYVOICE_HOST", "127.0.0.1")
 _COSYVOICE_DAEMON_PORT = int(os.environ.get("COSYVOICE_PORT", "8765"))
+# Kept-alive daemon connection, one per thread (http.client isn't thread-safe)
+_cosyvoice_http = threading.local()
+# Start the daemon on first use instead of loading the model per request
+# (set COSYVOICE_AUTOSTART=0 to always use the subprocess fallback)
+_COSYVOICE_AUTOSTART = os.environ.get("COSYVOICE_AUTOSTART", "1") != "0"
+_COSYVOICE_DAEMON_SCRIPT = _SCRIPT_DIR.parent / "scripts" / "cosyvoice-daemon.sh"
+_COSYVOICE_READY_TIMEOUT = 180  # Seconds to wait for warm-up after the script returns
+_daemon_start_lock = threading.Lock()
+_daemon_start_attempted = False
 
 
 def _is_cosyvoice_available() -> bool:
@@ -115,50 +231,115 @@ def _is_cosyvoice_available() -> bool:
     return _COSYVOICE_VENV.exists() and _COSYVOICE_MODEL.exists()
 
 
+def _cosyvoice_request(method: str, path: str, body: bytes | None = None, timeout: float = 60) -> tuple[int, bytes]:
+    """Send a request to the CosyVoice daemon, reusing this thread's connection.
+
+    Returns (status, body). A kept-alive connection the daemon has since
+    closed is replaced and the request retried once.
+    """
+    import http.client
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    while True:
+        conn = getattr(_cosyvoice_http, "conn", None)
+        reused = conn is not None
+        if conn is None:
+            conn = _cosyvoice_http.conn = http.client.HTTPConnection(
+                _COSYVOICE_DAEMON_HOST, _COSYVOICE_DAEMON_PORT, timeout=timeout)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            _cosyvoice_http.conn = None
+            # Only a stale connection is worth retrying; never a timeout
+            if not reused or isinstance(e, TimeoutError):
+                raise
+
+
 def _is_cosyvoice_daemon_running() -> bool:
-    """Check if the CosyVoice daemon is running."""
-    import urllib.request
-    import urllib.error
+    """Check if the CosyVoice daemon is running and ready (not still warming up)."""
+    import http.client
+    import json
     try:
-        url = f"http://{_COSYVOICE_DAEMON_HOST}:{_COSYVOICE_DAEMON_PORT}/health"
-        with urllib.request.urlopen(url, timeout=1) as resp:
-            return resp.status == 200
-    except (urllib.error.URLError, OSError):
+        status, body = _cosyvoice_request("GET", "/health", timeout=1)
+        # Daemons without a ready field are ready once they answer
+        return status == 200 and json.loads(body).get("ready", True)
+    except (http.client.HTTPException, OSError, ValueError):
         return False
 
 
+def _start_cosyvoice_daemon() -> bool:
+    """Start the daemon (once per process) and wait until it is ready. Returns True if it is."""
+    global _daemon_start_attempted
+    with _daemon_start_lock:
+        if _is_cosyvoice_daemon_running():
+            return True  # Started by another thread or process meanwhile
+        if _daemon_start_attempted or not _COSYVOICE_AUTOSTART:
+            return False
+        _daemon_start_attempted = True
+        try:
+            # The script keeps a PID file, so concurrent callers don't start two
+            subprocess.run(
+                [str(_COSYVOICE_DAEMON_SCRIPT), "start"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=180,  # It waits up to 2 minutes for the model to load
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        # The script returns once the server answers; a compiled model then
+        # still warms up before it reports ready
+        deadline = time.monotonic() + _COSYVOICE_READY_TIMEOUT
+        while not _is_cosyvoice_daemon_running():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(1)
+        return True
+
+
 def _synthesize_cosyvoice_daemon(text: str, lang: str = "zh", ref_audio: str = "") -> tuple:
     """Synthesize using the CosyVoice daemon (fast path)."""
-    import urllib.request
     import json
 
-    url = f"http://{_COSYVOICE_DAEMON_HOST}:{_COSYVOICE_DAEMON_PORT}/synthesize"
     payload = {"text": text, "lang": lang}
     if ref_audio:
         payload["ref_audio"] = ref_audio
     data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
 
-    with urllib.request.urlopen(req, timeout=60) as resp:
-        wav_bytes = resp.read()
+    status, wav_bytes = _cosyvoice_request("POST", "/synthesize", body=data, timeout=60)
+    if status != 200:
+        raise RuntimeError(f"CosyVoice daemon failed ({status}): {wav_bytes[:200].decode('utf-8', 'replace')}")
+
+    return _decode_wav(wav_bytes)
+
+
+# The daemon's fixed 44-byte header: mono 16-bit PCM, data chunk right after fmt
+_PCM16_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _decode_wav(wav_bytes: bytes) -> tuple:
+    """Decode WAV bytes to float32 samples, viewing the daemon's plain PCM16 layout directly."""
+    if len(wav_bytes) >= _PCM16_WAV_HEADER.size:
+        (riff, _size, wave, fmt, fmt_size, audio_format, channels, sample_rate,
+         _byte_rate, _align, bits, data, _data_size) = _PCM16_WAV_HEADER.unpack_from(wav_bytes)
+        if ((riff, wave, fmt, data) == (b"RIFF", b"WAVE", b"fmt ", b"data")
+                and (fmt_size, audio_format, channels, bits) == (16, 1, 1, 16)):
+            # The streamed header's data size is a placeholder, so use the body length
+            count = (len(wav_bytes) - _PCM16_WAV_HEADER.size) // 2
+            pcm = np.frombuffer(wav_bytes, dtype="<i2", offset=_PCM16_WAV_HEADER.size, count=count)
+            return np.multiply(pcm, 1 / 32768, dtype=np.float32), sample_rate
 
-    # Parse WAV bytes
     import io
-    samples, sample_rate = sf.read(io.BytesIO(wav_bytes))
-    return np.asarray(samples, dtype=np.float32), sample_rate
+    return sf.read(io.BytesIO(wav_bytes), dtype="float32")
 
 
 def _synthesize_cosyvoice_subprocess(text: str, lang: str = "zh", ref_audio: str = "") -> tuple:
     """Synthesize using subprocess (slow path, loads model each time)."""
-    # Create temp file for output
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        output_path = f.name
-
     # Default reference audio if not specified
     if not ref_audio:
         ref_audio = str(_COSYVOICE_DIR / "asset" / "zero_shot_prompt.wav")
@@ -167,13 +348,16 @@ def _synthesize_cosyvoice_subprocess(text: str, lang: str = "zh", ref_audio: str
     lang_tags = {"zh": "<|zh|>", "en": "<|en|>", "ja": "<|ja|>", "ko": "<|ko|>"}
     lang_tag = lang_tags.get(lang, "<|zh|>")
 
-    try:
-        # Build the Python script to run in CosyVoice venv
-        python_script = f'''
+    # Build the Python script to run in CosyVoice venv. It writes the sample
+    # rate and raw float32 PCM to stdout; anything else printed goes to stderr.
+    python_script = f'''
+import os
+import struct
 import sys
+out = os.fdopen(os.dup(1), 'wb')
+os.dup2(2, 1)
 sys.path.insert(0, 'third_party/Matcha-TTS')
 from cosyvoice.cli.cosyvoice import AutoModel
-import torchaudio
 
 cosyvoice = AutoModel(model_dir='pretrained_models/CosyVoice2-0.5B')
 
@@ -181,38 +365,35 @@ cosyvoice = AutoModel(model_dir='pretrained_models/CosyVoice2-0.5B')
 text = {repr(lang_tag)} + {repr(text)}
 
 for i, j in enumerate(cosyvoice.inference_cross_lingual(text, {repr(ref_audio)})):
-    torchaudio.save({repr(output_path)}, j['tts_speech'], cosyvoice.sample_rate)
+    out.write(struct.pack('<I', cosyvoice.sample_rate))
+    out.write(j['tts_speech'].cpu().numpy().astype('float32').tobytes())
     break
+out.flush()
 '''
 
-        # Run in CosyVoice venv
-        python_bin = _COSYVOICE_VENV / "bin" / "python"
-        result = subprocess.run(
-            [str(python_bin), "-c", python_script],
-            cwd=str(_COSYVOICE_DIR),
-            capture_output=True,
-            text=True,
-            timeout=120,  # 2 minute timeout for model loading + synthesis
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"CosyVoice failed: {result.stderr}")
+    # Run in CosyVoice venv
+    python_bin = _COSYVOICE_VENV / "bin" / "python"
+    result = subprocess.run(
+        [str(python_bin), "-c", python_script],
+        cwd=str(_COSYVOICE_DIR),
+        capture_output=True,
+        timeout=120,  # 2 minute timeout for model loading + synthesis
+    )
 
-        # Read the generated audio
-        samples, sample_rate = sf.read(output_path)
-        return np.asarray(samples, dtype=np.float32), sample_rate
+    if result.returncode != 0 or len(result.stdout) < 4:
+        raise RuntimeError(f"CosyVoice failed: {result.stderr.decode('utf-8', 'replace')}")
 
-    finally:
-        # Clean up temp file
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    (sample_rate,) = struct.unpack_from("<I", result.stdout)
+    # Copy out of the bytes object, so callers get a writable array like the other backends
+    return np.frombuffer(result.stdout, dtype=np.float32, offset=4).copy(), sample_rate
 
 
 def _synthesize_cosyvoice(text: str, voice: str = "zh_female", speed: float = DEFAULT_SPEED, lang: str | None = None, ref_audio: str = ""):
     """
     Synthesize speech using CosyVoice (for Chinese).
 
-    Tries daemon first (fast), falls back to subprocess (slow).
+    Tries daemon first (fast), starting it if needed, and falls back to
+    subprocess (slow).
     """
     if not _is_cosyvoice_available():
         raise FileNotFoundError(
@@ -233,13 +414,21 @@ def _synthesize_cosyvoice(text: str, voice: str = "zh_female", speed: float = DE
         ref_audio_path = str(_COSYVOICE_DIR / "asset" / "zero_shot_prompt.wav")
 
     # Try daemon first (fast path)
-    if _is_cosyvoice_daemon_running():
+    if _is_cosyvoice_daemon_running() or _start_cosyvoice_daemon():
         return _synthesize_cosyvoice_daemon(text, lang=lang, ref_audio=ref_audio_path)
 
     # Fall back to subprocess (slow path)
     return _synthesize_cosyvoice_subprocess(text, lang=lang, ref_audio=ref_audio_path)
 
 
+def _uses_cosyvoice_subprocess(voice: str) -> bool:
+    """True if synthesize() would load CosyVoice in a fresh subprocess for this voice."""
+    return (
+        bool(voice) and voice.startswith("cosyvoice_") and _is_cosyvoice_available()
+        and not (_is_cosyvoice_daemon_running() or _start_cosyvoice_daemon())
+    )
+
+
 # -----------------------------------------------------------------------------
 # Native Backend (kokoro with spacy) - for future use
 # -----------------------------------------------------------------------------
@@ -248,8 +437,10 @@ def _get_native_pipeline():
     """Lazy-load the native KPipeline."""
     global _native_pipeline
     if _native_pipeline is None:
-        from kokoro import KPipeline
-        _native_pipeline = KPipeline(lang_code="a")  # American English
+        with _load_lock:
+            if _native_pipeline is None:
+                from kokoro import KPipeline
+                _native_pipeline = KPipeline(lang_code="a")  # American English
     return _native_pipeline
 
 
@@ -261,7 +452,7 @@ def _synthesize_native(text: str, voice: str = DEFAULT_VOICE, lang: str | None =
     for _gs, _ps, audio in pipe(text, voice=voice, speed=speed):
         chunks.append(audio)
     if chunks:
-        return np.concatenate(chunks), SAMPLE_RATE
+        return np.concatenate(chunks, dtype=np.float32), SAMPLE_RATE
     return np.array([], dtype=np.float32), SAMPLE_RATE
 
 
@@ -298,6 +489,178 @@ def synthesize(text: str, voice: str = DEFAULT_VOICE, lang: str | None = None, s
         return _synthesize_onnx(text, voice, lang, speed)
 
 
+# Cache for synthesize_cached(), trimmed to the least recently used entries
+_CACHE_DIR = Path(os.environ.get("TTS_CACHE_DIR", Path.home() / ".cache" / "tts"))
+_CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_MB", "100")) << 20
+# Running size of the cache, so writes only rescan it when over budget
+# (None until the first trim_cache scan)
+_cache_bytes: int | None = None
+_cache_lock = threading.Lock()
+# Cache misses being synthesized right now, so identical concurrent calls share one run
+_in_flight: dict[Path, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def synthesize_cached(text: str, voice: str = DEFAULT_VOICE, lang: str | None = None, speed: float = DEFAULT_SPEED, ref_audio: str = ""):
+    """
+    Like synthesize(), but repeats are read back from a disk cache.
+
+    Entries are float32 WAVs under TTS_CACHE_DIR (default ~/.cache/tts),
+    keyed by the models, voice, speed, language and text, so hits return
+    exactly what synthesize() did. Identical calls made while the first is
+    still synthesizing wait for it and get a copy of its result.
+    """
+    key = f"{MODEL_TAG}|{voice}|{speed}|{lang}|{ref_audio}|{text}"
+    path = _CACHE_DIR / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.wav"
+    try:
+        os.utime(path)  # Mark as recently used
+    except FileNotFoundError:
+        pass
+    else:
+        samples, sample_rate = sf.read(path, dtype="float32")
+        return samples, sample_rate
+
+    with _in_flight_lock:
+        future = _in_flight.get(path)
+        owner = future is None
+        if owner:
+            future = _in_flight[path] = Future()
+    if not owner:
+        samples, sample_rate = future.result()
+        return samples.copy(), sample_rate  # The owner's caller has the original
+
+    try:
+        samples, sample_rate = synthesize(text, voice, lang, speed, ref_audio)
+        if len(samples):
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{os.getpid()}_{path.name}")
+            sf.write(tmp_path, samples, sample_rate, subtype="FLOAT")
+            os.replace(tmp_path, path)  # Readers never see a partial file
+            _note_cache_write(path.stat().st_size)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result((samples, sample_rate))
+    finally:
+        with _in_flight_lock:
+            del _in_flight[path]
+    return samples, sample_rate
+
+
+def trim_cache(max_bytes: int = _CACHE_MAX_BYTES) -> None:
+    """Delete the least recently used cache entries until the cache fits in max_bytes."""
+    global _cache_bytes
+    with _cache_lock:
+        entries = []
+        try:
+            with os.scandir(_CACHE_DIR) as it:
+                for entry in it:
+                    # Dotfiles are writes still in progress
+                    if entry.name.endswith(".wav") and not entry.name.startswith("."):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+        except FileNotFoundError:
+            _cache_bytes = 0
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        _cache_bytes = total
+
+
+def _note_cache_write(n_bytes: int) -> None:
+    """Account for a new cache entry, scanning and evicting only when over budget."""
+    global _cache_bytes
+    with _cache_lock:
+        if _cache_bytes is not None and _cache_bytes + n_bytes <= _CACHE_MAX_BYTES:
+            _cache_bytes += n_bytes
+            return
+    trim_cache()
+
+
+# Sentence boundaries; CJK punctuation isn't followed by a space
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text after sentence-ending punctuation, for incremental synthesis."""
+    sentences = [part for part in _SENTENCE_BREAK.split(text) if part.strip()]
+    return sentences or [text]
+
+
+def _text_blocks(text: str, min_chars: int) -> list[str]:
+    """Split text at sentence ends into blocks of at least min_chars (except the last)."""
+    blocks, start = [], 0
+    for m in _SENTENCE_BREAK.finditer(text):
+        if m.start() - start >= min_chars:
+            blocks.append(text[start:m.start()])
+            start = m.end()
+    if text[start:].strip() or not blocks:
+        blocks.append(text[start:])
+    return blocks
+
+
+def split_for_voice(text: str, voice: str) -> list[str]:
+    """Split text into sentences for incremental synthesis with this voice."""
+    # The CosyVoice subprocess fallback loads its model on every call, so
+    # it gets the whole text at once
+    return [text] if _uses_cosyvoice_subprocess(voice) else split_sentences(text)
+
+
+def synthesize_stream(text: str, voice: str = DEFAULT_VOICE, lang: str | None = None, speed: float = DEFAULT_SPEED, ref_audio: str = "", cache: bool = False):
+    """
+    Synthesize text a sentence at a time.
+
+    Yields (samples, sample_rate) per sentence, so callers can play or
+    write audio before the whole text is done. With cache=True, sentences
+    go through synthesize_cached().
+    """
+    synth = synthesize_cached if cache else synthesize
+    for sentence in split_for_voice(text, voice):
+        yield synth(sentence, voice, lang, speed, ref_audio)
+
+
+def warm_up(voice: str = DEFAULT_VOICE) -> None:
+    """Load the model and run one short synthesis, so the first real call is fast."""
+    synthesize("Hi.", voice=voice)
+    if TTS_BACKEND != "native":
+        # Long texts run on the sentence pool; load it now rather than mid-playback
+        _get_onnx_pool()
+
+
+def _load_backend() -> None:
+    """Load the selected backend's model, ignoring errors (the first synthesize() reports them)."""
+    try:
+        if TTS_BACKEND == "native":
+            _get_native_pipeline()
+        else:
+            _get_onnx_instance()
+            _get_onnx_pool()
+    except Exception:
+        pass
+
+
+def preload() -> None:
+    """Start loading the model in a background thread and return immediately."""
+    threading.Thread(target=_load_backend, daemon=True).start()
+
+
+if os.environ.get("TTS_PRELOAD") == "1":
+    preload()
+
+
+# Text synthesized per pipeline() chunk: several sentences for the parallel
+# ONNX path (see TTS_CHUNK_MIN), but a bounded amount of audio per chunk
+_PIPELINE_BLOCK_CHARS = 2000
+
+
 def pipeline(text: str, voice: str = DEFAULT_VOICE, speed: float = DEFAULT_SPEED):
     """
     Generate audio chunks for the given text.
@@ -305,27 +668,33 @@ def pipeline(text: str, voice: str = DEFAULT_VOICE, speed: float = DEFAULT_SPEED
     This function exists for API compatibility with tests.
     Yields tuples of (graphemes, phonemes, audio_array).
     """
-    samples, _sr = synthesize(text, voice, speed=speed)
-    # Yield as a single chunk to match the expected interface
-    yield None, None, samples
+    # Whole blocks of sentences keep the parallel ONNX path busy, while
+    # long texts never need to be held in memory all at once
+    blocks = [text] if _uses_cosyvoice_subprocess(voice) else _text_blocks(text, _PIPELINE_BLOCK_CHARS)
+    for block in blocks:
+        samples, _sr = synthesize_cached(block, voice, speed=speed)
+        yield None, None, samples
 
 
-def tts_file(text_path: str, wav_path: str, voice: str = DEFAULT_VOICE, speed: float = DEFAULT_SPEED) -> None:
-    """Convert text file to speech and save as WAV."""
+def tts_file(text_path: str, wav_path: str, voice: str = DEFAULT_VOICE, speed: float = DEFAULT_SPEED, subtype: str = "FLOAT") -> None:
+    """Convert text file to speech and save as WAV (float32 samples unless subtype says otherwise)."""
     with open(text_path, "r", encoding="utf-8") as f:
         text = f.read().strip()
 
     if not text:
         raise ValueError("Input text is empty")
 
-    # Use pipeline() to allow test mocking
-    chunks = []
-    for _gs, _ps, audio in pipeline(text, voice, speed):
-        chunks.append(audio)
-
-    if chunks:
-        combined = np.concatenate(chunks)
-        sf.write(wav_path, combined, SAMPLE_RATE)
+    # Use pipeline() to allow test mocking. Chunks are written as they
+    # arrive, so long texts never hold the whole recording in memory.
+    out = None
+    try:
+        for _gs, _ps, audio in pipeline(text, voice, speed):
+            if out is None:
+                out = sf.SoundFile(wav_path, "w", samplerate=SAMPLE_RATE, channels=1, subtype=subtype)
+            out.write(audio)
+    finally:
+        if out is not None:
+            out.close()
 
 
 def main() -> int:
@@ -335,10 +704,11 @@ def main() -> int:
     parser.add_argument("output", help="Output WAV file")
     parser.add_argument("-v", "--voice", default=DEFAULT_VOICE, help=f"Voice ID (default: {DEFAULT_VOICE})")
     parser.add_argument("-s", "--speed", type=float, default=DEFAULT_SPEED, help=f"Speed multiplier (default: {DEFAULT_SPEED})")
+    parser.add_argument("--subtype", default="FLOAT", help="WAV sample format, e.g. PCM_16 (default: FLOAT)")
     args = parser.parse_args()
 
     try:
-        tts_file(args.input, args.output, voice=args.voice, speed=args.speed)
+        tts_file(args.input, args.output, voice=args.voice, speed=args.speed, subtype=args.subtype)
         print(f"Wrote {args.output}")
         return 0
     except FileNotFoundError as e: